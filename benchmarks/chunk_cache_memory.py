@@ -0,0 +1,68 @@
+"""Benchmark for the memory accounting of chunk_cache.ChunkCache.
+
+Reads a large synthetic submission through the chunk cache and compares the
+bytes the cache counts against the growth of the process's resident memory.
+The two should stay close, so that the cache's memory limit bounds what it
+actually holds.  Resident memory is read from /proc, so this only runs on Linux.
+
+Run from the project root with:
+    poetry run python benchmarks/chunk_cache_memory.py
+"""
+
+import gc
+import os
+import tempfile
+from pathlib import Path
+
+from tabulate import tabulate
+
+from regtech_data_validator import validator
+from regtech_data_validator.chunk_cache import ChunkCache
+
+ALL_LOGIC_ERRORS = "./tests/data/all_logic_errors.csv"
+
+
+def resident_bytes() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def write_submission(path: Path, row_count: int):
+    # the rows are repeated as text, so no large dataframe is allocated before measuring
+    with open(ALL_LOGIC_ERRORS) as f:
+        header, *rows = f.read().splitlines()
+    with open(path, "w") as f:
+        f.write(header + "\n")
+        for _ in range(row_count // len(rows)):
+            f.writelines(row + "\n" for row in rows)
+
+
+def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for row_count in [10_000, 100_000, 500_000]:
+            path = Path(tmp_dir) / f"{row_count}.csv"
+            write_submission(path, row_count)
+
+            gc.collect()
+            before = resident_bytes()
+            cache = ChunkCache()
+            list(cache.read_through(validator._read_chunks(path, 10000, 1)))
+            resident = resident_bytes() - before
+            rows.append(
+                [
+                    row_count,
+                    f"{cache.cached_bytes / 2**20:.1f}",
+                    f"{resident / 2**20:.1f}",
+                    f"{cache.cached_bytes / resident:.2f}",
+                ]
+            )
+            cache.close()
+            del cache
+            gc.collect()
+
+    print(tabulate(rows, headers=["rows", "cached MiB", "resident MiB", "cached / resident"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark for data_formatters.format_findings.
+
+Formats synthetic findings, in the layout validator.validate produces before
+formatting, and reports the time per finding.  The time per finding should stay
+flat as the number of findings grows, and as the same number of findings is
+spread over more failing checks.
+
+Run from the project root with:
+    poetry run python benchmarks/format_findings.py
+"""
+
+import time
+
+import polars as pl
+from tabulate import tabulate
+
+from regtech_data_validator.data_formatters import format_findings
+from regtech_data_validator.engine import get_check_fields
+from regtech_data_validator.phase_validations import get_phase_1_schema_for_lei, get_phase_2_schema_for_lei
+
+
+def build_findings(checks: list[tuple], finding_count: int) -> pl.DataFrame:
+    # spread the findings evenly over the checks, one row per field of each finding
+    frames = []
+    per_check = finding_count // len(checks)
+    for check, fields in checks:
+        record_nos = pl.int_range(2, per_check + 2, dtype=pl.UInt32, eager=True)
+        for field in fields:
+            frames.append(
+                pl.DataFrame(
+                    {
+                        "record_no": record_nos,
+                        "field_name": pl.repeat(field, per_check, eager=True),
+                        "field_value": record_nos.cast(pl.String),
+                        "validation_id": pl.repeat(check.title, per_check, eager=True),
+                        "uid": record_nos.cast(pl.String),
+                    }
+                )
+            )
+    return pl.concat(frames)
+
+
+def time_format(findings: pl.DataFrame, checks: list) -> float:
+    start = time.perf_counter()
+    format_findings(findings, "Logical", checks)
+    return time.perf_counter() - start
+
+
+def main():
+    # only use single-field checks, so every finding has the same number of fields no matter how many checks fail
+    all_checks = [
+        (check, get_check_fields(check, column_name))
+        for schema in [get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei()]
+        for column_name, column in schema.columns.items()
+        for check in column.checks
+        if len(get_check_fields(check, column_name)) == 1
+    ]
+    sbl_checks = [check for check, _ in all_checks]
+
+    rows = []
+    check_count = 20
+    for finding_count in [10_000, 100_000, 1_000_000]:
+        findings = build_findings(all_checks[:check_count], finding_count)
+        seconds = time_format(findings, sbl_checks)
+        rows.append([finding_count, check_count, f"{seconds:.3f}", f"{seconds / finding_count * 1e6:.2f}"])
+
+    finding_count = 200_000
+    for check_count in [5, 25, 120]:
+        findings = build_findings(all_checks[:check_count], finding_count)
+        seconds = time_format(findings, sbl_checks)
+        rows.append([finding_count, check_count, f"{seconds:.3f}", f"{seconds / finding_count * 1e6:.2f}"])
+
+    print(tabulate(rows, headers=["findings", "failing checks", "seconds", "µs per finding"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
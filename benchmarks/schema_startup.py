@@ -0,0 +1,63 @@
+"""Startup benchmark for building the validation schemas.
+
+Reports the time to build the phase 1, phase 2 and register schemas for a
+submission, both when the schemas for the LEI have to be built (a cache miss)
+and when they were already built for an earlier submission (a cache hit), for
+the Pandera schemas and the compiled Polars engine schemas.
+
+Run from the project root with:
+    poetry run python benchmarks/schema_startup.py
+"""
+
+import time
+
+from tabulate import tabulate
+
+from regtech_data_validator.engine import (
+    get_compiled_phase_1_schema_for_lei,
+    get_compiled_phase_2_schema_for_lei,
+    get_compiled_register_schema,
+)
+from regtech_data_validator.phase_validations import (
+    get_phase_1_and_2_validations_for_lei,
+    get_phase_1_schema_for_lei,
+    get_phase_2_schema_for_lei,
+    get_register_schema,
+)
+
+
+def time_schemas(schema_getters: list, leis: list[str]) -> float:
+    # average time, in milliseconds, to get all of the schemas for one LEI
+    start = time.perf_counter()
+    for lei in leis:
+        for get_schema in schema_getters:
+            get_schema({"lei": lei})
+    return (time.perf_counter() - start) / len(leis) * 1000
+
+
+def main():
+    # warm up imports and the LEI independent register schemas
+    get_register_schema()
+    get_compiled_register_schema()
+
+    pandera_getters = [get_phase_1_schema_for_lei, get_phase_2_schema_for_lei, get_register_schema]
+    compiled_getters = [
+        get_compiled_phase_1_schema_for_lei,
+        get_compiled_phase_2_schema_for_lei,
+        # the compiled register schema doesn't depend on the LEI, so it takes no context
+        lambda _: get_compiled_register_schema(),
+    ]
+    leis = [f"{n:020d}" for n in range(20)]
+
+    rows = [
+        ["validations (phase 1 and 2 checks)", f"{time_schemas([get_phase_1_and_2_validations_for_lei], leis):.2f}"],
+        ["Pandera schemas, cache miss", f"{time_schemas(pandera_getters, leis):.2f}"],
+        ["Pandera schemas, cache hit", f"{time_schemas(pandera_getters, leis):.4f}"],
+        ["compiled schemas, cache miss", f"{time_schemas(compiled_getters, [lei[::-1] for lei in leis]):.2f}"],
+        ["compiled schemas, cache hit", f"{time_schemas(compiled_getters, [lei[::-1] for lei in leis]):.4f}"],
+    ]
+    print(tabulate(rows, headers=["schemas per submission", "ms"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
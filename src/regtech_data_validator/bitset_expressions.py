@@ -0,0 +1,121 @@
+"""Bitset equivalents of the `check_expressions` for multi-value enum fields.
+
+Enum fields hold one or more codes from a small, fixed set (at most 63 codes,
+like the 29 race codes), separated by ";".  Instead of splitting them into list
+columns, each field can be encoded once per chunk as an integer bitset, with
+one bit per code and one more bit for any value that isn't a code (see
+`check_expressions.bits`).  Checking enum validity, single-value restrictions,
+conditional conflicts and duplicates is then a matter of integer operations.
+
+Each function here takes the name of the column being checked, the codes of
+every enum field (see `engine.enum_codes`), and the keyword arguments of the
+check function of the same name.  It returns None when the check can't be
+expressed exactly with the bitsets, e.g. when it refers to a value that isn't
+one of the field's codes, in which case the list-based expression is used.
+"""
+
+from typing import Mapping
+
+import polars as pl
+
+from regtech_data_validator.check_expressions import OTHER_BIT, bits, blank, code_bits, stripped
+
+# bits 0-62 are for the codes, bit 63 is for anything else
+MAX_CODES = 63
+
+
+def _codes_of(codes: Mapping[str, list[str]], key: str, values) -> list[str] | None:
+    # the codes of the field, only when every one of values is one of them
+    field_codes = codes.get(key)
+    if field_codes is None or not set(values) <= set(field_codes):
+        return None
+    return field_codes
+
+
+def is_valid_enum(
+    key: str,
+    codes: Mapping[str, list[str]],
+    accepted_values: list[str],
+    accept_blank: bool = False,
+    separator: str = ";",
+) -> pl.Expr | None:
+    if len(accepted_values) > MAX_CODES:
+        return None
+    # the accepted values are the codes of the bitset, so any other value sets the other bit
+    return (blank(key) & accept_blank) | ((bits(key, accepted_values, separator) & OTHER_BIT) == 0)
+
+
+def has_valid_value_count(
+    key: str, codes: Mapping[str, list[str]], min_length: int, max_length: int = None, separator: str = ";"
+) -> pl.Expr:
+    # every value is followed by a separator, other than the last
+    value_count = pl.col(key).str.count_matches(separator, literal=True) + 1
+    return value_count.is_between(min_length, max_length)
+
+
+def is_unique_in_field(key: str, codes: Mapping[str, list[str]], separator: str = ";") -> pl.Expr | None:
+    field_codes = _codes_of(codes, key, [])
+    if field_codes is None:
+        return None
+    field_bits = bits(key, field_codes, separator)
+    # without other values, every value is a distinct code, so there are as many values as bits set
+    value_count = pl.col(key).str.count_matches(separator, literal=True) + 1
+    unique = field_bits.bitwise_count_ones().cast(pl.UInt32) == value_count
+    # other values may repeat each other, so only those few fields are split to check, the rest are nulled out
+    other = (field_bits & OTHER_BIT) != 0
+    split_values = pl.when(other).then(pl.col(key)).str.split(separator)
+    return pl.when(other).then(split_values.list.len() == split_values.list.unique().list.len()).otherwise(unique)
+
+
+def meets_multi_value_field_restriction(
+    key: str, codes: Mapping[str, list[str]], single_values: set[str], separator: str = ";"
+) -> pl.Expr | None:
+    field_codes = _codes_of(codes, key, single_values)
+    if field_codes is None:
+        return None
+    field_bits = bits(key, field_codes, separator)
+    single_bits = code_bits(field_codes, single_values)
+    # either none of the values are single values, or the field is just one of the single values
+    return ((field_bits & single_bits) == 0) | (
+        (field_bits.bitwise_count_ones() == 1) & ((field_bits & single_bits) != 0)
+    )
+
+
+def has_no_conditional_field_conflict(
+    key: str,
+    codes: Mapping[str, list[str]],
+    condition_values: set[str] = {"977"},
+    related_fields: str = "",
+    separator: str = ";",
+) -> pl.Expr | None:
+    field_codes = _codes_of(codes, related_fields, condition_values)
+    if field_codes is None:
+        return None
+    check_col = (bits(related_fields, field_codes, separator) & code_bits(field_codes, condition_values)) == 0
+    # the check fails if one expression was True but the other False
+    return ~(check_col ^ blank(key))
+
+
+def has_valid_enum_pair(
+    key: str,
+    codes: Mapping[str, list[str]],
+    conditions: list[list] = None,
+    related_fields: str = "",
+    separator: str = ";",
+) -> pl.Expr | None:
+    field_codes = _codes_of(codes, key, [condition["target_value"] for condition in conditions])
+    if field_codes is None:
+        return None
+    field_bits = bits(key, field_codes, separator)
+    related_field_value = stripped(related_fields)
+
+    # same as check_functions.check_condition, with the field values as a bitset
+    check_results = pl.lit(True)
+    for condition in conditions:
+        check = related_field_value.is_in(list(condition["condition_values"]))
+        if not condition["is_equal_condition"]:
+            check = ~check
+        has_target = (field_bits & code_bits(field_codes, [condition["target_value"]])) != 0
+        field_check = has_target if condition["should_equal_target"] else ~has_target
+        check_results = check_results & pl.when(check).then(field_check).otherwise(True)
+    return check_results
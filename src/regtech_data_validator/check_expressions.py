@@ -0,0 +1,388 @@
+"""Polars expression equivalents of the Pandera check functions.
+
+Each function here mirrors the check function of the same name in
+`check_functions`, but instead of taking a PolarsData object and returning
+a lazyframe, it takes the name of the column being checked and returns a
+boolean expression.  True means the row passed the check.
+
+Because these are plain expressions, every check for a phase can be placed
+into a single `LazyFrame.select`, which lets Polars optimize and evaluate all
+of them in one query (including eliminating the common sub-expressions, like
+splitting the same multi-value field, shared by several checks).
+
+The expressions must produce the same results as the check functions. A null
+result is treated as a pass, the same way Pandera ignores nulls in check output.
+
+Work that many checks repeat on the same field (parsing dates, splitting
+multi-value fields, testing for blanks) is done once per chunk instead, into
+normalized columns named `<field>:<kind>` (see `normalized_column`), and the
+expressions read those columns.  The engine adds the normalized columns to the
+chunk before evaluating the checks.
+"""
+
+import operator
+import sys
+import unicodedata
+from datetime import datetime
+from functools import cache
+
+import polars as pl
+
+from regtech_data_validator import global_data
+from regtech_data_validator.check_functions import check_condition
+
+# separates the field from the kind of normalization in the name of a normalized column.  Field names never
+# contain it.
+NORMALIZED_SEPARATOR = ":"
+
+
+def blank(key: str) -> pl.Expr:
+    # True when the field is empty, or only spaces
+    return pl.col(NORMALIZED_SEPARATOR.join([key, "blank"]))
+
+
+def date(key: str) -> pl.Expr:
+    # the field parsed as a date, null when it isn't one
+    return pl.col(NORMALIZED_SEPARATOR.join([key, "date"]))
+
+
+def split(key: str, separator: str = ";") -> pl.Expr:
+    # the values of a multi-value field
+    return pl.col(NORMALIZED_SEPARATOR.join([key, "split", separator]))
+
+
+def stripped(key: str) -> pl.Expr:
+    # the field without leading and trailing whitespace
+    return pl.col(NORMALIZED_SEPARATOR.join([key, "stripped"]))
+
+
+def number(key: str) -> pl.Expr:
+    # the field parsed as a float, null when it isn't one
+    return pl.col(NORMALIZED_SEPARATOR.join([key, "float"]))
+
+
+# the bit set in a bitset for any value that isn't one of the codes
+OTHER_BIT = 1 << 63
+
+
+def bits(key: str, codes: list[str], separator: str = ";") -> pl.Expr:
+    # the values of a multi-value enum field as a bitset, with bit i set when the field has codes[i].  Codes never
+    # contain the separator, so it joins them in the name.
+    return pl.col(NORMALIZED_SEPARATOR.join([key, "bits", separator, separator.join(codes)]))
+
+
+def code_bits(codes: list[str], values) -> int:
+    # the bitset of the given values, which must be codes
+    return sum(1 << codes.index(value) for value in set(values))
+
+
+def is_normalized_column(name: str) -> bool:
+    return NORMALIZED_SEPARATOR in name
+
+
+def normalized_field(name: str) -> str:
+    # the field a normalized column is computed from
+    return name.split(NORMALIZED_SEPARATOR, 1)[0]
+
+
+def is_bits(name: str) -> bool:
+    return name.split(NORMALIZED_SEPARATOR, 2)[1] == "bits"
+
+
+@cache
+def _non_ascii_digits() -> dict[str, str]:
+    # every Unicode decimal digit, other than 0-9, mapped to its ASCII digit
+    return {c: str(unicodedata.decimal(c)) for c in map(chr, range(128, sys.maxunicode + 1)) if c.isdecimal()}
+
+
+def _parse_floats(key: str) -> pl.Expr:
+    # float() strips the same whitespace as strip_chars()
+    stripped = pl.col(key).str.strip_chars()
+    floats = stripped.cast(pl.Float64, strict=False)
+    # float() also allows any Unicode decimal digit, and underscores between digits, which casting doesn't.
+    # Rewriting them is slow, so only the few values that didn't cast and might have them are rewritten, the
+    # others are nulled out first.
+    retry = floats.is_null() & stripped.str.contains(r"[^\x00-\x7f]|_")
+    digits = pl.when(retry).then(stripped).str.replace_many(_non_ascii_digits())
+    # each replace removes every other one of a run of underscores (1_2_3 -> 12_3), so two remove them all
+    for _ in range(2):
+        digits = digits.str.replace_all(r"(\d)_(\d)", "${1}${2}")
+    return pl.coalesce(floats, digits.cast(pl.Float64, strict=False))
+
+
+def _encode_bits(key: str, codes: list[str], separator: str) -> pl.Expr:
+    bit_of = {code: 1 << i for i, code in enumerate(codes)}
+
+    def encode(value: pl.Expr) -> pl.Expr:
+        return value.replace_strict(bit_of, default=OTHER_BIT, return_dtype=pl.UInt64)
+
+    # null values are split as blanks and nulled out after, since evaluating lists with nulls is far slower
+    values = pl.col(key)
+    split_bits = values.fill_null("").str.split(separator).list.eval(encode(pl.element()).bitwise_or())
+    return pl.when(values.is_not_null()).then(split_bits.list.first())
+
+
+def normalized_column(name: str) -> pl.Expr:
+    """
+    Get the expression that computes a normalized column from the raw field
+    Args:
+        name (str): name of the normalized column, as referred to by blank, date, split, number or bits
+    Returns:
+        pl.Expr computing the normalized column, aliased to name
+    """
+    key, kind, *args = name.split(NORMALIZED_SEPARATOR, 2)
+    if kind == "blank":
+        expr = pl.col(key).str.strip_chars() == ""
+    elif kind == "stripped":
+        expr = pl.col(key).str.strip_chars()
+    elif kind == "date":
+        # parsing non-strictly keeps a bad date from failing the whole query, is_date reports bad dates
+        expr = pl.col(key).str.strptime(pl.Date, "%Y%m%d", strict=False)
+    elif kind == "split":
+        expr = pl.col(key).str.split(args[0])
+    elif kind == "float":
+        expr = _parse_floats(key)
+    elif kind == "bits":
+        separator, codes = args[0].split(NORMALIZED_SEPARATOR, 1)
+        expr = _encode_bits(key, codes.split(separator), separator)
+    else:
+        raise ValueError(f"unknown normalized column {name}")
+    return expr.alias(name)
+
+
+def str_length(key: str, min_value: int | None = None, max_value: int | None = None) -> pl.Expr:
+    # equivalent of Pandera's built-in str_length check
+    n_chars = pl.col(key).str.len_chars()
+    if min_value is None:
+        return n_chars.le(max_value)
+    elif max_value is None:
+        return n_chars.ge(min_value)
+    return n_chars.is_between(min_value, max_value)
+
+
+# the characters str.strip() removes, which decide whether a value is blank for the element-wise check functions.
+# strip_chars() without characters leaves out \x1c-\x1f.
+_PY_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009"
+    "\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# the strings float() and int() accept, once the surrounding whitespace is stripped.  Like Python, \d matches any
+# Unicode decimal digit, and digits can be grouped with single underscores.
+_DIGITS = r"\d(?:_?\d)*"
+_FLOAT_PATTERN = (
+    rf"^[+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?|(?i:inf|infinity|nan))$"
+)
+_WHOLE_PATTERN = rf"^[+-]?{_DIGITS}$"
+
+
+def _py_blank(key: str) -> pl.Expr:
+    return pl.col(key).str.strip_chars(_PY_WHITESPACE) == ""
+
+
+def is_number(key: str, accept_blank: bool = False, is_whole: bool = False) -> pl.Expr:
+    # float() and int() strip the same whitespace as strip_chars()
+    value_check = pl.col(key).str.strip_chars().str.contains(_WHOLE_PATTERN if is_whole else _FLOAT_PATTERN)
+    return pl.when(_py_blank(key)).then(pl.lit(accept_blank)).otherwise(value_check)
+
+
+def _comparison(key: str, limit: str, accept_blank: bool, operand) -> pl.Expr:
+    # comparisons are only made in the logical phase, after is_number has passed for every row.  A value that
+    # isn't a number is null, which is treated as a pass.  Polars sorts NaN above every number, but comparing
+    # NaN is always False in Python.
+    return (
+        pl.when(_py_blank(key))
+        .then(pl.lit(accept_blank))
+        .when(number(key).is_nan())
+        .then(pl.lit(False))
+        .otherwise(operand(number(key), float(limit)))
+    )
+
+
+def is_greater_than_or_equal_to(key: str, min_value: str, accept_blank: bool = False) -> pl.Expr:
+    return _comparison(key, min_value, accept_blank, operator.ge)
+
+
+def is_greater_than(key: str, min_value: str, accept_blank: bool = False) -> pl.Expr:
+    return _comparison(key, min_value, accept_blank, operator.gt)
+
+
+def is_less_than(key: str, max_value: str, accept_blank: bool = False) -> pl.Expr:
+    return _comparison(key, max_value, accept_blank, operator.lt)
+
+
+# the code sets of global_data the checks use, by name
+CODE_SETS: dict[str, dict | set] = {
+    "census_geoids": global_data.census_geoids,
+    "naics_codes": global_data.naics_codes,
+}
+
+
+@cache
+def _code_values(name: str) -> pl.Series:
+    # the codes as a column, built once per code set rather than every time a schema is compiled
+    return pl.Series(list(CODE_SETS[name]), dtype=pl.String)
+
+
+def is_valid_code(key: str, accept_blank: bool = False, codes: dict | set = {}) -> pl.Expr:
+    # the codes (e.g. every census tract GEOID) as a column, so membership is one hashed lookup per value
+    # the schemas hold copies of the code sets, so they are matched by value, which is far cheaper than
+    # building the column
+    name = next((name for name, code_set in CODE_SETS.items() if code_set == codes), None)
+    code_values = _code_values(name) if name is not None else pl.Series(list(codes), dtype=pl.String)
+    return pl.when(_py_blank(key)).then(pl.lit(accept_blank)).otherwise(pl.col(key).is_in(code_values))
+
+
+def has_correct_length(key: str, accepted_length: int, accept_blank: bool = False) -> pl.Expr:
+    return pl.when(_py_blank(key)).then(pl.lit(accept_blank)).otherwise(pl.col(key).str.len_chars() == accepted_length)
+
+
+def _slice(key: str, start_idx: int | None, end_idx: int | None) -> pl.Expr:
+    # the same characters as value[start_idx:end_idx]
+    start_idx = start_idx or 0
+    if start_idx >= 0 and (end_idx is None or end_idx >= 0):
+        return pl.col(key).str.slice(start_idx, None if end_idx is None else max(end_idx - start_idx, 0))
+
+    # negative indexes count back from the end of each value
+    n_chars = pl.col(key).str.len_chars()
+
+    def index(idx: int) -> pl.Expr:
+        return pl.lit(idx) if idx >= 0 else (n_chars + idx).clip(lower_bound=0)
+
+    start = index(start_idx)
+    end = n_chars if end_idx is None else index(end_idx)
+    return pl.col(key).str.slice(start, (end - start).clip(lower_bound=0))
+
+
+def string_contains(key: str, containing_value: str = None, start_idx: int = None, end_idx: int = None) -> pl.Expr:
+    if containing_value is None:
+        # e.g. no LEI to compare the uid to
+        return pl.repeat(True, pl.len())
+    return _slice(key, start_idx, end_idx) == containing_value
+
+
+def is_date(key: str) -> pl.Expr:
+    # polars striptime uses chrono format which allows for non-padded %d, so check
+    # that a full 8 digits are present in the date.
+    return pl.col(key).str.contains(r'^\d{8}$') & date(key).is_not_null()
+
+
+def _non_empty_values(key: str, separator: str) -> pl.Expr:
+    # split the field values, strip off empty spaces and only keep non-empty values
+    return (
+        split(key, separator)
+        .list.eval(pl.element().str.strip_chars())
+        .list.eval(pl.element().filter(pl.element() != ""))
+    )
+
+
+def has_valid_multi_field_value_count(
+    key: str,
+    max_length: int,
+    ignored_values: set[str] = set(),
+    related_fields: str = "",
+    separator: str = ";",
+) -> pl.Expr:
+    groupby_lengths = _non_empty_values(related_fields, separator).list.set_difference(list(ignored_values)).list.len()
+    field_lengths = _non_empty_values(key, separator).list.set_difference(list(ignored_values)).list.len()
+    return (groupby_lengths + field_lengths) <= max_length
+
+
+def has_no_conditional_field_conflict(
+    key: str,
+    condition_values: set[str] = {"977"},
+    related_fields: str = "",
+    separator: str = ";",
+) -> pl.Expr:
+    check_col = split(related_fields, separator).list.set_intersection(list(condition_values)).list.len() == 0
+    val_col = blank(key)
+    # the check fails if one expression was True but the other False
+    return ~(check_col ^ val_col)
+
+
+def is_unique_in_field(key: str, separator: str = ";") -> pl.Expr:
+    val_list = split(key, separator).list
+    return val_list.len() == val_list.unique().list.len()
+
+
+def is_valid_enum(
+    key: str,
+    accepted_values: list[str],
+    accept_blank: bool = False,
+    separator: str = ";",
+) -> pl.Expr:
+    return (blank(key) & accept_blank) | (split(key, separator).list.set_difference(accepted_values).list.len() == 0)
+
+
+def meets_multi_value_field_restriction(key: str, single_values: set[str], separator: str = ";") -> pl.Expr:
+    values = split(key, separator).list
+    single_values = list(single_values)
+    # either none of the values are single values, or the field is just one of the single values
+    return (values.set_intersection(single_values).list.len() == 0) | (
+        (values.set_difference(single_values).list.len() == 0) & (values.unique().list.len() == 1)
+    )
+
+
+def has_valid_value_count(key: str, min_length: int, max_length: int = None, separator: str = ";") -> pl.Expr:
+    return split(key, separator).list.len().is_between(min_length, max_length)
+
+
+def is_date_in_range(key: str, start_date_value: str, end_date_value: str) -> pl.Expr:
+    start_date = datetime.strptime(start_date_value, "%Y%m%d")
+    end_date = datetime.strptime(end_date_value, "%Y%m%d")
+    # dates are only compared in the logical phase, after is_date has passed for every row.  A bad date is
+    # null, which is treated as a pass.
+    return date(key).is_between(start_date, end_date)
+
+
+def is_date_after(key: str, related_fields: str = "") -> pl.Expr:
+    return date(related_fields) <= date(key)
+
+
+def has_valid_enum_pair(
+    key: str,
+    conditions: list[list] = None,
+    related_fields: str = "",
+    separator: str = ";",
+) -> pl.Expr:
+    related_field_value = stripped(related_fields)
+    field_values = split(key, separator)
+    check_results = pl.lit(True)
+    for condition in conditions:
+        check_results = check_results & check_condition(condition, field_values, related_field_value)
+    return check_results
+
+
+def is_date_before_in_days(key: str, days_value: int = 730, related_fields: str = "") -> pl.Expr:
+    return (date(key) - date(related_fields)).dt.total_days() < days_value
+
+
+def has_valid_format(key: str, regex: str, accept_blank: bool = False) -> pl.Expr:
+    return (blank(key) & accept_blank) | pl.col(key).str.contains(regex)
+
+
+def is_unique_column(key: str, related_fields: str = "", count_limit: int = 1) -> pl.Expr:
+    return pl.col(key).is_unique()
+
+
+def has_valid_fieldset_pair(
+    key: str,
+    condition_values: list[str],
+    related_fields: list[str],
+    should_fieldset_key_equal_to: dict({str: (int, bool, str)}) = None,
+) -> pl.Expr:
+    conditions = [
+        pl.col(field) == target_value if must_equal else pl.col(field) != target_value
+        for field, (_, must_equal, target_value) in should_fieldset_key_equal_to.items()
+    ]
+    combined_conditions = conditions[0]
+    for cond in conditions[1:]:
+        combined_conditions &= cond
+
+    return (
+        pl.when(~pl.col(key).is_in(condition_values))
+        .then(pl.lit(True))
+        .when(combined_conditions)
+        .then(pl.lit(True))
+        .otherwise(pl.lit(False))
+    )
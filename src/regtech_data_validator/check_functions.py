@@ -135,16 +135,9 @@ def has_valid_multi_field_value_count(
     groupby_lengths = groupby_list.list.set_difference(list(ignored_values)).list.len()
     field_lengths = check_field_list.list.set_difference(list(ignored_values)).list.len()
 
-    # evaluate the expressions on the lazyframe, putting the results into the alias columnns, and
-    # collect just the results of the expressions
-    rf = (
-        lf.with_columns([groupby_lengths.alias("groupby_length"), field_lengths.alias("field_length")])
-        .select(["groupby_length", "field_length"])
-        .collect()
-    )
     # sum up the total lengths of the related and field values and compare to the max_length
-    check_results = (rf["groupby_length"] + rf["field_length"]) <= max_length
-    return pl.DataFrame({"check_results": check_results}).lazy()
+    check_results = (groupby_lengths + field_lengths) <= max_length
+    return lf.select(check_results.alias("check_results"))
 
 
 def has_no_conditional_field_conflict(
@@ -165,15 +158,12 @@ def has_no_conditional_field_conflict(
     # expression to split the related field value and alias a boolean if the intersection with the conditional values is empty
     check_col = (
         pl.col(related_fields).str.split(separator).list.set_intersection(list(condition_values)).list.len() == 0
-    ).alias("check_col")
+    )
     # expression to check if the check field value is empty
-    val_col = (pl.col(field_data.key).str.strip_chars().str.len_chars() == 0).alias("val_col")
-
-    rf = lf.with_columns([check_col, val_col]).select(["check_col", "val_col"]).collect()
-    rf = rf["check_col"] ^ rf["val_col"]
+    val_col = pl.col(field_data.key).str.strip_chars().str.len_chars() == 0
 
     # flip the results of ^ so that the check fails if one expression was True but the other False
-    return pl.DataFrame({"check_results": ~rf}).lazy()
+    return lf.select((~(check_col ^ val_col)).alias("check_results"))
 
 
 def is_unique_in_field(
@@ -245,20 +235,15 @@ def is_date_in_range(field_data: pa.PolarsData, start_date_value: str, end_date_
 def is_date_after(
     field_data: pa.PolarsData,
     related_fields: str = "",
-) -> pl.Series:
+) -> pl.LazyFrame:
 
     lf = field_data.lazyframe
 
     related_dates = pl.col(related_fields).str.strptime(pl.Date, "%Y%m%d")
     check_col_dates = pl.col(field_data.key).str.strptime(pl.Date, "%Y%m%d")
 
-    # evaluates the above strings to dates expressions and puts them into new columns, and then
-    # collects just those columns for comparison, verifying the related field date is less than
-    # or equal to the check field date (happens on or before)
-    rf = lf.with_columns([related_dates.alias("check_date_tmp"), check_col_dates.alias("v_date_tmp")])
-    rf = rf.select(["check_date_tmp", "v_date_tmp"]).collect()
-    check_results = rf['check_date_tmp'] <= rf['v_date_tmp']
-    return pl.DataFrame({"check_results": check_results}).lazy()
+    # verifies the related field date is less than or equal to the check field date (happens on or before)
+    return lf.select((related_dates <= check_col_dates).alias("check_results"))
 
 
 def is_number(ct_value: str, accept_blank: bool = False, is_whole: bool = False) -> bool:
@@ -363,24 +348,16 @@ def check_condition(condition, field_values, related_field_value):
     return pl.when(check).then(field_check_exp).otherwise(True)
 
 
-def is_date_before_in_days(field_data: pa.PolarsData, days_value: int = 730, related_fields: str = "") -> pl.Series:
+def is_date_before_in_days(field_data: pa.PolarsData, days_value: int = 730, related_fields: str = "") -> pl.LazyFrame:
 
     lf = field_data.lazyframe
-    # builds a dataframe by converting the check and related fields from strings to dates and putting them
-    # into columns
-    rf = lf.with_columns(
-        [
-            pl.col(related_fields).str.strptime(pl.Date, "%Y%m%d").alias("check_date_tmp"),
-            pl.col(field_data.key).str.strptime(pl.Date, "%Y%m%d").alias("v_date_tmp"),
-        ]
-    )
-    rf = rf.select(["v_date_tmp", "check_date_tmp"]).collect()
+    # expressions converting the check and related fields from strings to dates
+    check_dates = pl.col(related_fields).str.strptime(pl.Date, "%Y%m%d")
+    value_dates = pl.col(field_data.key).str.strptime(pl.Date, "%Y%m%d")
 
-    # diff the two columns as date objects and verify the diff in days is less than the max days
-    diff_values = (rf['v_date_tmp'] - rf['check_date_tmp']).dt.total_days()
-    check_results = diff_values < days_value
-    rf = pl.DataFrame({"check_results": check_results}).lazy()
-    return rf
+    # diff the two dates and verify the diff in days is less than the max days
+    diff_values = (value_dates - check_dates).dt.total_days()
+    return lf.select((diff_values < days_value).alias("check_results"))
 
 
 def has_correct_length(ct_value: str, accepted_length: int, accept_blank: bool = False) -> bool:
@@ -437,12 +414,10 @@ def has_valid_format(field_data: pa.PolarsData, regex: str, accept_blank: bool =
     return rf.select("check_results")
 
 
-def is_unique_column(field_data: pa.PolarsData, related_fields: str = "", count_limit: int = 1) -> pl.Series:
+def is_unique_column(field_data: pa.PolarsData, related_fields: str = "", count_limit: int = 1) -> pl.LazyFrame:
 
     # uses polars column is_unique() function to check there are no duplicate values
-    rf = field_data.lazyframe.select(field_data.key).collect().is_unique()
-    rf = pl.DataFrame({"check_results": rf}).lazy()
-    return rf
+    return field_data.lazyframe.select(pl.col(field_data.key).is_unique().alias("check_results"))
 
 
 def has_valid_fieldset_pair(
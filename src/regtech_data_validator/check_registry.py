@@ -0,0 +1,83 @@
+"""A process-wide registry of every SBLCheck, indexed by validation id.
+
+The registry is built once, the first time it is requested, and is read-only
+afterwards.  It is used to look up the static data of a check (name,
+description, fig link, severity and scope) when formatting findings, without
+rebuilding the phase schemas or scanning a list of checks.
+
+The checks in the registry are built without a context, so the LEI based
+parameters of a check (W0003) are not set.  Use the phase schemas to validate
+data; use the registry for check metadata."""
+
+from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
+from typing import Mapping
+
+import polars as pl
+
+from regtech_data_validator.checks import SBLCheck
+from regtech_data_validator.phase_validations import (
+    get_phase_1_and_2_validations_for_lei,
+    get_phase_2_register_validations,
+)
+from regtech_data_validator.validation_results import ValidationPhase
+
+
+@dataclass(frozen=True)
+class CheckRegistry:
+    checks: Mapping[str, SBLCheck]
+    phases: Mapping[ValidationPhase, tuple[SBLCheck, ...]]
+    columns: Mapping[str, tuple[SBLCheck, ...]]
+    # one row per check, with columns named the same as the findings columns they populate:
+    # validation_id, validation_name, validation_description, fig_link, validation_type (severity) and scope
+    metadata: pl.DataFrame
+
+    def get(self, validation_id: str) -> SBLCheck:
+        return self.checks[validation_id]
+
+    def for_phase(self, phase: ValidationPhase) -> tuple[SBLCheck, ...]:
+        return self.phases[phase]
+
+    def for_column(self, column: str) -> tuple[SBLCheck, ...]:
+        return self.columns.get(column, ())
+
+
+def _build_registry() -> CheckRegistry:
+    checks: dict[str, SBLCheck] = {}
+    phases: dict[ValidationPhase, list[SBLCheck]] = {phase: [] for phase in ValidationPhase}
+    columns: dict[str, list[SBLCheck]] = {}
+
+    # register checks are run in the logical phase, after the phase 2 checks
+    for validations in [get_phase_1_and_2_validations_for_lei(), get_phase_2_register_validations()]:
+        for column, column_validations in validations.items():
+            for phase, phase_checks in column_validations.items():
+                for check in phase_checks:
+                    if check.title in checks:
+                        raise ValueError(f'Validation id {check.title} is used by more than one check')
+                    checks[check.title] = check
+                    phases[phase].append(check)
+                    columns.setdefault(column, []).append(check)
+
+    metadata = pl.DataFrame(
+        {
+            "validation_id": [check.title for check in checks.values()],
+            "validation_name": [check.name for check in checks.values()],
+            "validation_description": [check.description for check in checks.values()],
+            "fig_link": [check.fig_link for check in checks.values()],
+            "validation_type": [check.severity.value for check in checks.values()],
+            "scope": [check.scope for check in checks.values()],
+        }
+    )
+
+    return CheckRegistry(
+        checks=MappingProxyType(checks),
+        phases=MappingProxyType({phase: tuple(phase_checks) for phase, phase_checks in phases.items()}),
+        columns=MappingProxyType({column: tuple(column_checks) for column, column_checks in columns.items()}),
+        metadata=metadata,
+    )
+
+
+@cache
+def get_check_registry() -> CheckRegistry:
+    return _build_registry()
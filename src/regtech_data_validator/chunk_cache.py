@@ -0,0 +1,84 @@
+"""A cache of the parsed chunks of a submission, so that the csv only has to be
+read and parsed once, even though it is validated in two phases.
+
+Chunks are kept in memory until their combined size reaches the cache's memory
+limit.  Chunks after that are written to Arrow IPC files in a temporary
+directory, and memory mapped when they are read back, so the cache never holds
+much more than the memory limit no matter the size of the submission."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+import polars as pl
+
+# default amount of parsed chunks kept in memory, in bytes.  Chunks past this are spilled to disk.
+MAX_CACHED_BYTES = 512 * 1024 * 1024
+
+
+def chunk_size(df: pl.DataFrame) -> int:
+    """
+    Get the memory held by a chunk, in bytes.  DataFrame.estimated_size leaves out most of the views of
+    string columns, undercounting a parsed csv several times over, so the sizes of the Arrow buffers that
+    the chunk actually holds are added up instead.  Exporting the chunk to Arrow doesn't copy them.
+    Args:
+        df (pl.DataFrame): the chunk
+    Returns:
+        size of the chunk's buffers, counting buffers shared between columns once
+    """
+    return df.to_arrow(compat_level=pl.CompatLevel.newest()).get_total_buffer_size()
+
+
+class ChunkCache:
+    def __init__(self, max_cached_bytes: int = MAX_CACHED_BYTES):
+        self.max_cached_bytes = max_cached_bytes
+        self.cached_bytes = 0
+        # (row_start, chunk) where chunk is either the dataframe itself, or the path to its spill file
+        self._chunks: list[tuple[int, pl.DataFrame | Path]] = []
+        self._spill_dir: str | None = None
+        self.complete = False
+
+    def append(self, row_start: int, df: pl.DataFrame):
+        size = chunk_size(df)
+        if self.cached_bytes + size <= self.max_cached_bytes:
+            self.cached_bytes += size
+            self._chunks.append((row_start, df))
+            return
+
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="chunks_")
+        spill_path = Path(self._spill_dir) / f"{len(self._chunks)}.arrow"
+        # uncompressed, so that the file can be memory mapped when it is read back
+        df.write_ipc(spill_path, compression="uncompressed")
+        self._chunks.append((row_start, spill_path))
+
+    def read_through(self, chunks: Iterator[tuple[int, pl.DataFrame]]) -> Iterator[tuple[int, pl.DataFrame]]:
+        """
+        Cache every chunk as it is read.  The cache is only complete once every chunk has been read.
+        Args:
+            chunks (Iterator): (row_start, df) for each chunk of the submission
+        Returns:
+            Iterator over the same chunks
+        """
+        for row_start, df in chunks:
+            self.append(row_start, df)
+            yield row_start, df
+        self.complete = True
+
+    def __iter__(self) -> Iterator[tuple[int, pl.DataFrame]]:
+        if not self.complete:
+            raise RuntimeError("Chunk cache read before every chunk of the submission was cached")
+        for row_start, chunk in self._chunks:
+            yield row_start, (chunk if isinstance(chunk, pl.DataFrame) else pl.read_ipc(chunk, memory_map=True))
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill_dir is not None
+
+    def close(self):
+        self._chunks = []
+        self.cached_bytes = 0
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
@@ -89,7 +89,9 @@ def validate(
     final_df = pl.DataFrame()
     # path = "s3://cfpb-devpub-regtech-sbl-filing-main/upload/2024/1234364890REGTECH006/156.csv"
     for validation_results in validate_batch_csv(path, context_dict, batch_size=50000, batch_count=1):
-        total_findings += validation_results.error_counts.total_count + validation_results.warning_counts.total_count
+        total_findings = (
+            validation_results.total_error_counts.total_count + validation_results.total_warning_counts.total_count
+        )
         final_phase = validation_results.phase
         all_findings.append(validation_results)
 
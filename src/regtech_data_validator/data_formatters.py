@@ -7,30 +7,8 @@ from functools import partial
 
 from io import BytesIO
 
+from regtech_data_validator.check_registry import get_check_registry
 from regtech_data_validator.checks import SBLCheck
-from regtech_data_validator.validation_results import ValidationPhase
-from regtech_data_validator.phase_validations import (
-    get_phase_1_schema_for_lei,
-    get_phase_2_schema_for_lei,
-    get_register_schema,
-)
-
-
-def find_check(group_name, checks):
-    gen = (check for check in checks if check.title == group_name)
-    return next(gen)
-
-
-def get_checks(phase):
-    if phase == ValidationPhase.SYNTACTICAL:
-        syntax_schema = get_phase_1_schema_for_lei()
-        checks = [check for col_schema in syntax_schema.columns.values() for check in col_schema.checks]
-    else:
-        logic_schema = get_phase_2_schema_for_lei()
-        checks = [check for col_schema in logic_schema.columns.values() for check in col_schema.checks]
-        register_schema = get_register_schema()
-        checks.extend([check for col_schema in register_schema.columns.values() for check in col_schema.checks])
-    return checks
 
 
 # Takes the error dataframe, which is a bit obscure, and translates it to a format of:
@@ -38,78 +16,67 @@ def get_checks(phase):
 # which corresponds to severity, error/warning code, name of error/warning, row number in sblar, UID, fig link,
 # error/warning description (markdown formatted), single/multi/register, and the fields and values associated with the error/warning.
 # Each row in the final dataframe represents all data for that one finding.
-def format_findings(df: pl.DataFrame, phase, checks):
-    final_df = pl.DataFrame()
-
-    sorted_df = df.with_columns(pl.col('validation_id').cast(pl.Categorical(ordering='lexical'))).sort('validation_id')
+# Every validation group is formatted in the same vectorized pass, with a single pivot and a join for the
+# check metadata, so the cost is linear in the number of findings no matter how many checks failed.
+def format_findings(df: pl.DataFrame, phase, checks: list[SBLCheck] | None = None):
+    # in the error dataframe, each field is its own row, so count those and put them into field_name_field_number_#
+    # and field_value_field_number_# columns to break out eventually to related field_# and value_#
+    numbered_df = df.with_columns(
+        pl.col('record_no').cum_count().over(['validation_id', 'record_no', 'uid']).alias('field_number')
+    )
+    # swap two-field errors/warnings to keep order of FIG
+    numbered_df = numbered_df.with_columns(
+        pl.when(pl.col('field_number').max().over('validation_id') == 2)
+        .then(3 - pl.col('field_number'))
+        .otherwise(pl.col('field_number'))
+        .alias('field_number')
+    )
+    df_pivot = numbered_df.pivot(
+        on="field_number",
+        index=["validation_id", "record_no", "uid"],
+        values=["field_name", "field_value"],
+        aggregate_function="first",
+        sort_columns=True,
+    )
+    df_pivot.columns = [
+        col.replace('field_name_', 'field_').replace('field_value_', 'value_') for col in df_pivot.columns
+    ]
 
-    # validation_id is a tuple returned from the group_by, so we'll be getting [0] for the actual error/warning code
-    for validation_id, group in sorted_df.group_by(["validation_id"], maintain_order=True):
-        validation_id = validation_id[0]
-        # in the error dataframe, each field is its own row, so count those and put them into field_name_field_number_#
-        # and field_value_field_number_# columns to break out eventually to related field_# and value_#
-        group = group.with_columns(pl.col('record_no').cum_count().over(['record_no', 'uid']).alias('field_number'))
-        df_pivot = group.pivot(
-            index=[
-                "record_no",
-                "uid",
-            ],
-            columns="field_number",
-            values=["field_name", "field_value"],
-            aggregate_function="first",
-        )
-        df_pivot.columns = [
-            (
-                col.replace('field_name_', 'field_').replace('field_value_', 'value_')
-                if ('field_name_' in col or 'field_value_' in col)
-                else col
-            )
-            for col in df_pivot.columns
-        ]
+    # match field_1 with value_1, field_2 with value_2, etc
+    field_count = numbered_df['field_number'].max()
+    sorted_columns = [col for num in range(1, field_count + 1) for col in (f"field_{num}", f"value_{num}")]
 
-        check = find_check(validation_id, checks)
-        # convert the SBLCheck data into column data
-        df_pivot = df_pivot.with_columns(
-            validation_type=pl.lit(check.severity.value),
-            validation_id=pl.lit(validation_id),
-            scope=pl.lit(check.scope),
-            # validation_description=pl.lit(check.description),
-            # validation_name=pl.lit(check.name),
-            # fig_link=pl.lit(check.fig_link),
-        ).rename(
+    # convert the SBLCheck data into column data, joined on validation_id instead of looking up each check.
+    # Unless specific checks are given, the static data comes from the check registry.
+    if checks is None:
+        checks_df = get_check_registry().metadata.select(["validation_id", "validation_type", "scope"])
+    else:
+        checks_df = pl.DataFrame(
             {
-                "record_no": "row",
-                "uid": "unique_identifier",
+                "validation_id": [check.title for check in checks],
+                "validation_type": [check.severity.value for check in checks],
+                "scope": [check.scope for check in checks],
             }
         )
-        # match field_1 with value_1, field_2 with value_2, etc
-        field_columns = [col for col in df_pivot.columns if col.startswith('field_')]
-        value_columns = [col for col in df_pivot.columns if col.startswith('value_')]
-        sorted_columns = [col for pair in zip(field_columns, value_columns) for col in pair]
-
-        # swap two-field errors/warnings to keep order of FIG
-        if len(field_columns) == 2:
-            df_pivot = df_pivot.with_columns(
-                field_1=pl.col('field_2'),
-                value_1=pl.col('value_2'),
-                field_2=pl.col('field_1'),
-                value_2=pl.col('value_1'),
-            )
-
-        # adjust row by 1 and concat group with final dataframe
-        df_pivot = df_pivot.with_columns(row=pl.col('row') + 1).select(
+
+    # polars str columns sort by entry, not lexigraphical sorting like we'd expect, so cast the column to use
+    # standard python str column sorting, keeping the record order within each validation_id
+    return (
+        df_pivot.join(checks_df, on="validation_id", how="left", maintain_order="left")
+        .sort(pl.col('validation_id').cast(pl.Categorical(ordering='lexical')), maintain_order=True)
+        .select(
             [
                 "validation_type",
                 "validation_id",
-                "row",
-                "unique_identifier",
+                # adjust row by 1
+                (pl.col('record_no') + 1).alias('row'),
+                pl.col('uid').alias('unique_identifier'),
                 "scope",
             ]
             + sorted_columns
         )
-        final_df = pl.concat([final_df, df_pivot], how="diagonal")
-        final_df = final_df.with_columns(phase=pl.lit(phase))
-    return final_df
+        .with_columns(phase=pl.lit(phase))
+    )
 
 
 def df_to_download(
@@ -136,22 +103,11 @@ def df_to_download(
         buffer.seek(0)
         return buffer.getvalue()
 
-    # get the check for the phase the results were in, so we can pull out static data from each
-    # found check
-    checks = get_checks(df.select(pl.first("phase")).item())
-
-    # place the static data into a dataframe, and then join the results frame with it where the validation ids are the same.
-    # This is much faster than applying the fields
-    check_values = [
-        {
-            "validation_id": check.title,
-            "validation_description": check.description,
-            "validation_name": check.name,
-            "fig_link": check.fig_link,
-        }
-        for check in checks
-    ]
-    checks_df = pl.DataFrame(check_values)
+    # the check registry has the static data of every check in a dataframe, so join the results frame with it
+    # where the validation ids are the same.  This is much faster than applying the fields
+    checks_df = get_check_registry().metadata.select(
+        ["validation_id", "validation_description", "validation_name", "fig_link"]
+    )
     joined_df = df.join(checks_df, on="validation_id")
 
     # Sort by validation id, order the field and value columns so they end up like field_1, value_1, field_2, value_2,...
@@ -229,11 +185,7 @@ def df_to_dicts(df: pl.DataFrame, max_records: int = 10000, max_group_size: int
             'validation_id'
         )
 
-        checks = get_checks(df.select(pl.first("phase")).item())
-
-        partial_process_group = partial(
-            process_group_data, json_results=json_results, group_size=max_group_size, checks=checks
-        )
+        partial_process_group = partial(process_group_data, json_results=json_results, group_size=max_group_size)
 
         # collecting just the currently processed group from a lazyframe is faster and more efficient than using "apply"
         sorted_df.lazy().group_by('validation_id').map_groups(partial_process_group, schema=None).collect()
@@ -250,9 +202,9 @@ def truncate_validation_group_records(group, group_size):
     return truncated_group, need_to_truncate
 
 
-def process_group_data(group_df, json_results, group_size, checks):
+def process_group_data(group_df, json_results, group_size):
     validation_id = group_df['validation_id'].item(0)
-    check = find_check(validation_id, checks)
+    check = get_check_registry().get(validation_id)
     trunc_group, need_to_truncate = truncate_validation_group_records(group_df, group_size)
     group_json = process_chunk(trunc_group, validation_id, check)
     if group_json:
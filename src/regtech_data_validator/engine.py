@@ -0,0 +1,593 @@
+"""A Pandera-free check engine.
+
+Running a Pandera schema evaluates each check with its own backend call, builds
+a failure case frame for every failed check, and hands the failures back to the
+validator inside of a SchemaErrors exception.  For large submissions most of
+the validation time is spent in that overhead rather than in the checks.
+
+This engine compiles the SBLChecks of a schema into Polars expressions, using
+the equivalents in `check_expressions`, and evaluates every check for a chunk
+of data in a single `LazyFrame.select` of boolean columns, one per check id.
+That single query is collected once, with common sub-expression elimination
+turned on, so work shared by checks on the same field is only done once.
+"""
+
+from dataclasses import dataclass, fields
+from enum import StrEnum
+from functools import cache, lru_cache, partial
+from typing import Callable, Mapping
+
+import pandera.polars as pa
+import polars as pl
+from pandera import Check
+from pandera.api.function_dispatch import Dispatcher
+from pandera.backends.polars import builtin_checks
+
+from regtech_data_validator import bitset_expressions, check_expressions, check_functions
+from regtech_data_validator.bitset_expressions import MAX_CODES
+from regtech_data_validator.checks import SBLCheck
+from regtech_data_validator.phase_validations import (
+    SCHEMA_CACHE_SIZE,
+    get_phase_1_schema_for_lei,
+    get_phase_2_schema_for_lei,
+    get_register_schema,
+)
+from regtech_data_validator.validation_results import ValidationPhase
+
+
+class ValidationEngine(StrEnum):
+    PANDERA = "pandera"
+    POLARS = "polars"
+
+
+# maps Pandera check functions to a function that builds the equivalent Polars expression
+EXPRESSION_BUILDERS: dict[Callable, Callable[..., pl.Expr]] = {
+    builtin_checks.str_length: check_expressions.str_length,
+    check_functions.is_date: check_expressions.is_date,
+    check_functions.has_valid_multi_field_value_count: check_expressions.has_valid_multi_field_value_count,
+    check_functions.has_no_conditional_field_conflict: check_expressions.has_no_conditional_field_conflict,
+    check_functions.is_unique_in_field: check_expressions.is_unique_in_field,
+    check_functions.is_valid_enum: check_expressions.is_valid_enum,
+    check_functions.has_valid_value_count: check_expressions.has_valid_value_count,
+    check_functions.is_date_in_range: check_expressions.is_date_in_range,
+    check_functions.is_date_after: check_expressions.is_date_after,
+    check_functions.has_valid_enum_pair: check_expressions.has_valid_enum_pair,
+    check_functions.is_date_before_in_days: check_expressions.is_date_before_in_days,
+    check_functions.has_valid_format: check_expressions.has_valid_format,
+    check_functions.is_unique_column: check_expressions.is_unique_column,
+    check_functions.has_valid_fieldset_pair: check_expressions.has_valid_fieldset_pair,
+    check_functions.is_number: check_expressions.is_number,
+    check_functions.is_greater_than_or_equal_to: check_expressions.is_greater_than_or_equal_to,
+    check_functions.is_greater_than: check_expressions.is_greater_than,
+    check_functions.is_less_than: check_expressions.is_less_than,
+    check_functions.is_valid_code: check_expressions.is_valid_code,
+    check_functions.string_contains: check_expressions.string_contains,
+    check_functions.has_correct_length: check_expressions.has_correct_length,
+    check_functions.meets_multi_value_field_restriction: check_expressions.meets_multi_value_field_restriction,
+}
+
+# maps check functions to a function that builds the equivalent expression over bitset encoded enum fields, see
+# bitset_expressions.  Only used when compiling with bitsets.
+BITSET_BUILDERS: dict[Callable, Callable[..., pl.Expr | None]] = {
+    check_functions.is_valid_enum: bitset_expressions.is_valid_enum,
+    check_functions.has_valid_value_count: bitset_expressions.has_valid_value_count,
+    check_functions.is_unique_in_field: bitset_expressions.is_unique_in_field,
+    check_functions.meets_multi_value_field_restriction: bitset_expressions.meets_multi_value_field_restriction,
+    check_functions.has_no_conditional_field_conflict: bitset_expressions.has_no_conditional_field_conflict,
+    check_functions.has_valid_enum_pair: bitset_expressions.has_valid_enum_pair,
+}
+
+# check functions whose result for a row depends on the other rows of the column
+COLUMN_WISE_FUNCTIONS = {check_functions.is_unique_column}
+
+# with distinct=True, row-wise checks are evaluated on the distinct values of a chunk's column, and the results
+# gathered back to its rows, unless more than this fraction of the column's values are distinct
+DISTINCT_RATIO = 0.5
+
+
+# Gets all associated field names from the check
+def get_check_fields(check: Check, primary_column: str) -> list[str]:
+
+    field_list = [primary_column]
+    if "related_fields" in check._check_kwargs:
+        related_fields = check._check_kwargs["related_fields"]
+        if related_fields:
+            # related_fields can be a single str or list of str
+            if isinstance(related_fields, str):
+                field_list.append(related_fields)
+            else:
+                field_list.extend(related_fields)
+    # remove possible dupes but maintain order
+    field_list = list(dict.fromkeys(field_list))
+    return field_list
+
+
+@dataclass(frozen=True)
+class CompiledCheck:
+    check: SBLCheck
+    column: str
+    fields: list[str]
+    # boolean expression, aliased to the check id, where True means the row passed.  None when the
+    # check function has no expression equivalent, in which case the check function itself is run.
+    expr: pl.Expr | None
+    # names of the normalized columns expr reads, see check_expressions.normalized_column
+    normalized: tuple[str, ...] = ()
+    # whether evaluating the check calls back into Python, which can't safely run alongside other threads, see
+    # validator._validate_chunks
+    runs_python: bool = False
+    # whether the result of each row only depends on the value of column in that row, so that expr can be
+    # evaluated on the distinct values of the column
+    row_wise: bool = False
+
+    @property
+    def id(self) -> str:
+        return self.check.title
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    name: ValidationPhase
+    columns: list[str]
+    checks: list[CompiledCheck]
+    # evaluate the row-wise checks on the distinct values of their column, see compile_schema
+    distinct: bool = False
+
+    @property
+    def runs_python(self) -> bool:
+        return any(c.runs_python for c in self.checks)
+
+
+# The options of a validation that only the Polars engine supports, see validator.validate_batch_csv
+@dataclass(frozen=True)
+class PolarsOptions:
+    validation_ids: list[str] | None = None
+    bitsets: bool = False
+    distinct: bool = False
+    categorical: bool = False
+
+    def check_engine(self, engine: ValidationEngine):
+        """
+        Raise a ValueError if any of the options is set for an engine other than the Polars engine
+        Args:
+            engine (ValidationEngine): the engine the options are used with
+        """
+        if engine == ValidationEngine.POLARS:
+            return
+        for option in fields(self):
+            if getattr(self, option.name) != option.default:
+                raise ValueError(f"{option.name} is only supported by the {ValidationEngine.POLARS} engine")
+
+
+def select_checks(schema: CompiledSchema, validation_ids: list[str]) -> CompiledSchema:
+    """
+    Get a compiled schema with only the given checks of schema, for example to get the findings for
+    just those checks after a summary run.
+    Args:
+        schema (CompiledSchema): compiled schema to select the checks from
+        validation_ids (list[str]): ids of the checks to keep.  Ids not in schema are ignored.
+    Returns:
+        CompiledSchema with the selected checks, in the same order as schema
+    """
+    checks = [c for c in schema.checks if c.id in validation_ids]
+    # only the columns the selected checks are on, so the other columns don't need to be read
+    check_columns = {c.column for c in checks}
+    return CompiledSchema(
+        name=schema.name,
+        columns=[c for c in schema.columns if c in check_columns],
+        checks=checks,
+        distinct=schema.distinct,
+    )
+
+
+def required_columns(schema: CompiledSchema) -> list[str]:
+    """
+    Get the columns of the data that validating against schema reads, so that only those columns have to
+    be loaded.  Checks read the column they are on and their related_fields, and findings read the uid.
+    Args:
+        schema (CompiledSchema): compiled schema that will be validated against
+    Returns:
+        list of column names, without duplicates
+    """
+    columns = ["uid", *schema.columns]
+    for compiled in schema.checks:
+        columns.extend(compiled.fields)
+    return list(dict.fromkeys(columns))
+
+
+def _check_function(check: Check) -> Callable:
+    # Pandera's built-in checks are dispatched on the type of data being checked
+    if isinstance(check._check_fn, Dispatcher):
+        return check._check_fn._function_registry[pa.PolarsData]
+    return check._check_fn
+
+
+@cache
+def enum_codes() -> dict[str, list[str]]:
+    """
+    Get the codes of every enum field that has few enough of them to be encoded as a bitset, which are the
+    values accepted by the field's is_valid_enum check.  The enum values don't depend on the LEI.
+    Returns:
+        dict of field name to its codes
+    """
+    codes = {}
+    for column_name, column in get_phase_1_schema_for_lei().columns.items():
+        for check in column.checks:
+            accepted_values = check._check_kwargs.get("accepted_values")
+            if _check_function(check) is check_functions.is_valid_enum and len(accepted_values) <= MAX_CODES:
+                codes.setdefault(column_name, accepted_values)
+    return codes
+
+
+def _vectorized_expr(check: SBLCheck, column: str, bitsets: bool) -> pl.Expr | None:
+    check_fn = _check_function(check)
+    if bitsets and check_fn in BITSET_BUILDERS:
+        expr = BITSET_BUILDERS[check_fn](column, enum_codes(), **check._check_kwargs)
+        # the bitset builders return None for checks they can't express exactly, which fall back to the lists
+        if expr is not None:
+            return expr
+    if check_fn in EXPRESSION_BUILDERS:
+        return EXPRESSION_BUILDERS[check_fn](column, **check._check_kwargs)
+    return None
+
+
+def compile_check(check: SBLCheck, column: str, bitsets: bool = False) -> CompiledCheck:
+    fields = get_check_fields(check, column)
+    expr = _vectorized_expr(check, column, bitsets)
+    if expr is not None:
+        expr = expr.alias(check.title)
+        root_names = expr.meta.root_names()
+        normalized = tuple(dict.fromkeys(name for name in root_names if check_expressions.is_normalized_column(name)))
+        row_wise = _check_function(check) not in COLUMN_WISE_FUNCTIONS and all(
+            check_expressions.normalized_field(name) == column for name in root_names
+        )
+        return CompiledCheck(
+            check=check, column=column, fields=fields, expr=expr, normalized=normalized, row_wise=row_wise
+        )
+
+    if check.element_wise:
+        # element-wise check functions without an expression equivalent are run on each value
+        expr = pl.col(column).map_elements(
+            partial(_check_function(check), **check._check_kwargs), return_dtype=pl.Boolean
+        )
+        return CompiledCheck(check=check, column=column, fields=fields, expr=expr.alias(check.title), runs_python=True)
+
+    # the check function itself is run on the data
+    return CompiledCheck(check=check, column=column, fields=fields, expr=None, runs_python=True)
+
+
+# bitsets=True evaluates the checks of enum fields over bitsets of their codes, rather than lists of their
+# values, see bitset_expressions.  distinct=True evaluates the row-wise checks on the distinct values of their
+# column, which is faster for low cardinality columns like flags and enums.  The results are the same either way.
+def compile_schema(schema: pa.DataFrameSchema, bitsets: bool = False, distinct: bool = False) -> CompiledSchema:
+    checks = []
+    for column_name, column in schema.columns.items():
+        for check in column.checks:
+            if not isinstance(check, SBLCheck):
+                raise RuntimeError(
+                    f'Check {check} type on {column_name} column not supported. Must be of type {SBLCheck}'
+                )
+            checks.append(compile_check(check, column_name, bitsets))
+    return CompiledSchema(name=schema.name, columns=list(schema.columns.keys()), checks=checks, distinct=distinct)
+
+
+# Like the Pandera schemas, compiled schemas are cached for the LEIs most recently validated, and must not be
+# modified.
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _get_compiled_schema_for_lei(
+    phase: ValidationPhase, lei: str | None, bitsets: bool = False, distinct: bool = False
+) -> CompiledSchema:
+    get_schema = get_phase_1_schema_for_lei if phase == ValidationPhase.SYNTACTICAL else get_phase_2_schema_for_lei
+    return compile_schema(get_schema({"lei": lei} if lei is not None else None), bitsets, distinct)
+
+
+def get_compiled_phase_1_schema_for_lei(
+    context: dict[str, str] | None = None, bitsets: bool = False, distinct: bool = False
+) -> CompiledSchema:
+    lei = context.get("lei", None) if context else None
+    return _get_compiled_schema_for_lei(ValidationPhase.SYNTACTICAL, lei, bitsets, distinct)
+
+
+def get_compiled_phase_2_schema_for_lei(
+    context: dict[str, str] | None = None, bitsets: bool = False, distinct: bool = False
+) -> CompiledSchema:
+    lei = context.get("lei", None) if context else None
+    return _get_compiled_schema_for_lei(ValidationPhase.LOGICAL, lei, bitsets, distinct)
+
+
+# the register checks don't depend on the LEI, so there is only the one compiled register schema
+@cache
+def get_compiled_register_schema() -> CompiledSchema:
+    return compile_schema(get_register_schema())
+
+
+def _check_results(schema: CompiledSchema, df: pl.DataFrame) -> pl.LazyFrame:
+    for column in required_columns(schema):
+        if column not in df.columns:
+            raise RuntimeError(f"column '{column}' not in dataframe. Columns in dataframe: {df.columns}")
+
+    results = []
+    row_checks = []
+    distinct_checks: dict[str, list[CompiledCheck]] = {}
+    for compiled in schema.checks:
+        if _on_distinct_values(schema, compiled, df):
+            distinct_checks.setdefault(compiled.column, []).append(compiled)
+        else:
+            row_checks.append(compiled)
+    for column, checks in distinct_checks.items():
+        values, offsets = distinct_values(df[column])
+        # the categories of an encoded column are always checked, rather than decoding the column
+        if values.len() > df.height * DISTINCT_RATIO and df.schema[column] != pl.Categorical:
+            # mostly distinct values are cheaper to check on every row
+            row_checks.extend(checks)
+            continue
+        distinct = _add_normalized(values.to_frame(column), {name for c in checks for name in c.normalized})
+        distinct_results = _collect(distinct.lazy().select(c.expr for c in checks))
+        results.append(distinct_results.select(pl.all().gather(offsets)).lazy())
+
+    lf = _add_normalized(df, {name for c in row_checks for name in c.normalized})
+    # the other checks compare encoded fields as they are, but Python check functions are given strings
+    lf = decode(lf, [field for c in row_checks if c.runs_python for field in c.fields]).lazy()
+    exprs = [c.expr for c in row_checks if c.expr is not None]
+    if exprs:
+        results.append(lf.select(exprs))
+    for compiled in row_checks:
+        if compiled.expr is None:
+            output = partial(compiled.check._check_fn, **compiled.check._check_kwargs)(
+                pa.PolarsData(lf, compiled.column)
+            )
+            results.append(output.select(pl.first().alias(compiled.id)))
+    if not results:
+        # no checks, e.g. after select_checks
+        return pl.LazyFrame()
+    return pl.concat(results, how="horizontal").select(c.id for c in schema.checks)
+
+
+# Row-wise checks are evaluated on the distinct values of their column with distinct, and always for encoded
+# columns, whose categories are already their distinct values.  The checks can then use .str on the categories.
+def _on_distinct_values(schema: CompiledSchema, compiled: CompiledCheck, df: pl.DataFrame) -> bool:
+    return compiled.row_wise and (schema.distinct or df.schema.get(compiled.column) == pl.Categorical)
+
+
+def normalize(schemas: list[CompiledSchema], df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Add the normalized columns (parsed dates, split multi-value fields, blank masks) read by the checks of
+    the schemas to the data, so that each is computed once for the chunk rather than by every check, and
+    by every phase evaluated at once, that reads it.  Normalized columns the data already has are kept as
+    they are.
+    Args:
+        schemas (list[CompiledSchema]): compiled schemas that the data will be validated against
+        df (pl.DataFrame): data to normalize
+    Returns:
+        pl.DataFrame with the normalized columns appended
+    """
+    # the checks evaluated on distinct values normalize the distinct values instead
+    names = {
+        name
+        for schema in schemas
+        for c in schema.checks
+        if not _on_distinct_values(schema, c, df)
+        for name in c.normalized
+    }
+    return _add_normalized(df, names)
+
+
+def _add_normalized(df: pl.DataFrame, names: set[str]) -> pl.DataFrame:
+    # fields missing from the data are left for the checks to report
+    names = [
+        name
+        for name in sorted(names)
+        if name not in df.columns and check_expressions.normalized_field(name) in df.columns
+    ]
+    if not names:
+        return df
+
+    # enum fields have few distinct values, which are far cheaper to encode as bitsets than every row.  The
+    # normalized columns of dictionary-encoded fields are computed from their categories the same way.
+    columns = []
+    names_by_field: dict[str, list[str]] = {}
+    for name in names:
+        field = check_expressions.normalized_field(name)
+        if check_expressions.is_bits(name) or df.schema[field] == pl.Categorical:
+            names_by_field.setdefault(field, []).append(name)
+        else:
+            columns.append(check_expressions.normalized_column(name))
+    for field, field_names in names_by_field.items():
+        values, offsets = distinct_values(df[field])
+        normalized = values.to_frame(field).select(check_expressions.normalized_column(name) for name in field_names)
+        columns.extend(column.gather(offsets) for column in normalized.get_columns())
+    return df.with_columns(columns)
+
+
+def distinct_values(values: pl.Series) -> tuple[pl.Series, pl.Series]:
+    """
+    Get the distinct values of a column, so that work on each value only has to be done once
+    Args:
+        values (pl.Series): values of the column
+    Returns:
+        the distinct values (as strings, followed by a null), and the offset of each row's value in them
+    """
+    # the physical values of a local categorical are the offsets of its categories
+    categorical = values.cast(pl.Categorical).cat.to_local()
+    categories = categorical.cat.get_categories()
+    return categories.extend_constant(None, 1), categorical.to_physical().fill_null(categories.len())
+
+
+def encode(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Dictionary-encode the enum fields of the data as categoricals, which take far less memory than the
+    strings when the data is held between phases.  Unlike pl.Enum, every value is kept, so values that
+    aren't codes are still reported by the checks, and in the findings, as they were submitted.
+    Args:
+        df (pl.DataFrame): data to encode
+    Returns:
+        pl.DataFrame with the enum fields as pl.Categorical
+    """
+    columns = [column for column in enum_codes() if df.schema.get(column) == pl.String]
+    if not columns:
+        return df
+    return df.with_columns(pl.col(columns).cast(pl.Categorical))
+
+
+def decode(df: pl.DataFrame, columns: list[str] | None = None) -> pl.DataFrame:
+    """
+    Cast the fields dictionary-encoded by encode back to strings, for check functions that need the strings
+    Args:
+        df (pl.DataFrame): data to decode
+        columns (list[str] | None): the fields to decode, or None for every encoded field
+    Returns:
+        pl.DataFrame with the categorical fields as pl.String
+    """
+    columns = [
+        column
+        for column, dtype in df.schema.items()
+        if dtype == pl.Categorical and (columns is None or column in columns)
+    ]
+    if not columns:
+        return df
+    return df.with_columns(pl.col(columns).cast(pl.String))
+
+
+def _collect(lf: pl.LazyFrame) -> pl.DataFrame:
+    try:
+        return lf.collect(comm_subexpr_elim=True, comm_subplan_elim=True)
+    except pl.exceptions.PolarsError as err:
+        # equivalent of the CHECK_ERROR Pandera reports when the check itself has a coding error
+        raise RuntimeError(err) from err
+
+
+def evaluate_checks(schema: CompiledSchema, df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Evaluate every check in the compiled schema against the data
+    Args:
+        schema (CompiledSchema): compiled checks to evaluate
+        df (pl.DataFrame): data to be validated
+    Returns:
+        pl.DataFrame with a boolean column per check id, where False means the row failed the check
+    """
+    return _collect(_check_results(schema, df))
+
+
+def find_failed_rows(schema: CompiledSchema, df: pl.DataFrame) -> dict[str, pl.Series]:
+    """
+    Evaluate every check in the compiled schema against the data, returning the rows that failed each
+    check.  Failures are returned directly rather than raised, and the row offsets never leave Polars.
+    Args:
+        schema (CompiledSchema): compiled checks to evaluate
+        df (pl.DataFrame): data to be validated
+    Returns:
+        dict of check id to a UInt32 Series of the offsets (from the start of df) of the rows that
+        failed the check.  Checks with no failures map to an empty Series.
+    """
+    # null check results are ignored, the same as Pandera does
+    failed_rows = _collect(_check_results(schema, df).select(pl.all().not_().fill_null(False).arg_true().implode()))
+    return {check_id: failed_rows[check_id][0].alias(check_id) for check_id in failed_rows.columns}
+
+
+def count_failures(schema: CompiledSchema, df: pl.DataFrame) -> dict[str, int]:
+    """
+    Evaluate every check in the compiled schema against the data, only counting the rows that failed
+    each check.  Cheaper than find_failed_rows when the findings themselves aren't needed.
+    Args:
+        schema (CompiledSchema): compiled checks to evaluate
+        df (pl.DataFrame): data to be validated
+    Returns:
+        dict of check id to the number of rows that failed the check
+    """
+    failure_counts = _collect(_check_results(schema, df).select(pl.all().not_().fill_null(False).sum()))
+    return failure_counts.row(0, named=True)
+
+
+def cap_failed_rows(
+    failed_rows: dict[str, pl.Series],
+    max_findings: int | None = None,
+    max_findings_per_check: int | None = None,
+    kept_per_check: Mapping[str, int] | None = None,
+) -> dict[str, pl.Series]:
+    """
+    Keep only the failed rows that will be turned into findings, so findings past the caps are never
+    built.  Findings are reported by validation id, then row, so the rows are kept in that order.
+    Args:
+        failed_rows (dict[str, pl.Series]): failed row offsets per check id, see find_failed_rows
+        max_findings (int | None): the most failed rows to keep in total, or None for no limit
+        max_findings_per_check (int | None): the most failed rows to keep for each check, or None for no limit
+        kept_per_check (Mapping[str, int] | None): the failed rows already kept for each check id, in earlier
+            chunks, which count towards max_findings_per_check
+    Returns:
+        dict of check id to the failed row offsets that were kept
+    """
+    kept_per_check = kept_per_check or {}
+    capped_rows = {}
+    remaining = max_findings
+    for check_id in sorted(failed_rows):
+        rows = failed_rows[check_id]
+        if max_findings_per_check is not None:
+            rows = rows.head(max(max_findings_per_check - kept_per_check.get(check_id, 0), 0))
+        if remaining is not None:
+            rows = rows.head(remaining)
+            remaining -= rows.len()
+        capped_rows[check_id] = rows
+    return capped_rows
+
+
+def build_findings(
+    schema: CompiledSchema,
+    df: pl.DataFrame,
+    failed_rows: dict[str, pl.Series],
+    row_start: int,
+    field_count: int = 0,
+) -> pl.DataFrame:
+    """
+    Build the findings for the failed rows directly in the wide layout produced by
+    data_formatters.format_findings, with one row per finding and the check fields and their values
+    in field_#/value_# columns.  Only the failed rows and the check fields are ever gathered.
+    Args:
+        schema (CompiledSchema): compiled checks that were evaluated
+        df (pl.DataFrame): data that was validated
+        failed_rows (dict[str, pl.Series]): failed row offsets per check id, see find_failed_rows
+        row_start (int): offset of the first row of df in the submission
+        field_count (int): the fewest field_#/value_# columns to have, e.g. for the fields of checks whose
+            failed rows were capped away, see cap_failed_rows.  Missing fields are null.
+    Returns:
+        pl.DataFrame of findings, sorted by validation id and row
+    """
+    lf = df.lazy()
+    findings = []
+    for compiled in sorted(schema.checks, key=lambda c: c.id):
+        rows = failed_rows[compiled.id]
+        if rows.is_empty():
+            continue
+
+        # swap two-field errors/warnings to keep order of FIG
+        fields = compiled.fields[::-1] if len(compiled.fields) == 2 else compiled.fields
+        field_columns = []
+        for field_number, field in enumerate(fields, start=1):
+            field_columns.append(pl.lit(field).alias(f"field_{field_number}"))
+            value = pl.col(field).gather(rows)
+            # only the values of the failed rows of encoded fields are decoded
+            if df.schema[field] == pl.Categorical:
+                value = value.cast(pl.String)
+            field_columns.append(value.alias(f"value_{field_number}"))
+
+        # row is 1-based and accounts for the csv header, so it is offset by 2 from the row index
+        findings.append(
+            lf.select(
+                pl.lit(compiled.check.severity.value).alias("validation_type"),
+                pl.lit(compiled.id).alias("validation_id"),
+                pl.lit(rows + (row_start + 2)).alias("row"),
+                pl.col("uid").gather(rows).alias("unique_identifier"),
+                pl.lit(compiled.check.scope).alias("scope"),
+                *field_columns,
+            )
+        )
+
+    if not findings:
+        return pl.DataFrame()
+    findings = pl.concat(findings, how="diagonal")
+    # the field columns are numbered consecutively, so the missing ones follow the last of them
+    findings_field_count = max(len(c.fields) for c in schema.checks if not failed_rows[c.id].is_empty())
+    findings = findings.with_columns(
+        pl.lit(None, pl.String).alias(f"{column}_{field_number}")
+        for field_number in range(findings_field_count + 1, field_count + 1)
+        for column in ("field", "value")
+    )
+    return findings.with_columns(phase=pl.lit(schema.name.value)).collect()
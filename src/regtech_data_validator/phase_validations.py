@@ -4,8 +4,11 @@ Defined in validation_results.ValidationPhase.
 This mapping is used to populate the schema template object and create
 an instance of a PanderaSchema object for SYNTACTICAL and LOGICAL phases"""
 
+import copy
+
 import pandera.polars as pa
 
+from functools import cache, lru_cache
 from textwrap import dedent
 
 from regtech_data_validator import global_data
@@ -36,36 +39,63 @@ from regtech_data_validator.checks import SBLCheck, Severity
 from regtech_data_validator.schema_template import get_template, get_register_template
 from regtech_data_validator.validation_results import ValidationPhase
 
-# Get separate schema templates for phase 1 and 2
+# Get separate schema templates for phase 1 and 2.  The templates are never modified, schemas
+# are built from copies of the template columns, so schemas can be built concurrently.
 phase_1_template = get_template()
 phase_2_template = get_template()
 register_template = get_register_template()
 
+# Maximum number of (phase, LEI) schemas kept in memory.  Building a schema builds every check in the FIG,
+# so schemas are cached for the LEIs most recently validated rather than built for every submission.
+SCHEMA_CACHE_SIZE = 128
+
+
+def _get_lei(context: dict[str, str] | None) -> str | None:
+    return context.get("lei", None) if context else None
+
+
+def _build_schema(template: dict, validations: dict, phase: str):
+    columns = {}
+    for column, template_column in template.items():
+        # Pandera's shallow copy of a column (copy.copy, and so Column.update_checks) shares its __dict__ with
+        # the original, so setting the checks on it would set them on the template, racing with other threads
+        # building a schema.  The template columns have no checks, so deep copying them is cheap.
+        column_schema = copy.deepcopy(template_column)
+        column_schema.checks = validations[column][phase]
+        columns[column] = column_schema
+    return pa.DataFrameSchema(columns, name=phase)
+
 
 def get_schema_by_phase_for_lei(template: dict, phase: str, context: dict[str, str] | None = None):
-    for column in get_phase_1_and_2_validations_for_lei(context):
-        validations = get_phase_1_and_2_validations_for_lei(context)[column]
-        template[column].checks = validations[phase]
+    # build the validations once, rather than once per column
+    return _build_schema(template, get_phase_1_and_2_validations_for_lei(context), phase)
 
-    return pa.DataFrameSchema(template, name=phase)
+
+# The cached schemas are shared by every caller validating for the same LEI, so they must not be modified.
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _get_cached_schema_for_lei(phase: ValidationPhase, lei: str | None):
+    template = phase_1_template if phase == ValidationPhase.SYNTACTICAL else phase_2_template
+    return get_schema_by_phase_for_lei(template, phase, {"lei": lei} if lei is not None else None)
 
 
 def get_phase_1_schema_for_lei(context: dict[str, str] | None = None):
-    return get_schema_by_phase_for_lei(phase_1_template, ValidationPhase.SYNTACTICAL, context)
+    return _get_cached_schema_for_lei(ValidationPhase.SYNTACTICAL, _get_lei(context))
 
 
 def get_phase_2_schema_for_lei(context: dict[str, str] | None = None):
-    return get_schema_by_phase_for_lei(phase_2_template, ValidationPhase.LOGICAL, context)
+    return _get_cached_schema_for_lei(ValidationPhase.LOGICAL, _get_lei(context))
 
 
 # since we process the data in chunks/batch, we need to handle all file/register
-# checks separately, as a separate set of schema and checks.
-def get_register_schema(context: dict[str, str] | None = None):
-    for column in get_phase_2_register_validations(context):
-        validations = get_phase_2_register_validations(context)[column]
-        register_template[column].checks = validations[ValidationPhase.LOGICAL]
+# checks separately, as a separate set of schema and checks.  The register checks
+# don't depend on the LEI, so there is only ever one register schema.
+@cache
+def _get_cached_register_schema():
+    return _build_schema(register_template, get_phase_2_register_validations(), ValidationPhase.LOGICAL)
 
-    return pa.DataFrameSchema(register_template, name=ValidationPhase.LOGICAL)
+
+def get_register_schema(context: dict[str, str] | None = None):
+    return _get_cached_register_schema()
 
 
 # since we process the data in chunks/batch, we need to handle all file/register
@@ -95,7 +125,7 @@ def get_phase_2_register_validations(context: dict[str, str] | None = None):
 
 
 def get_phase_1_and_2_validations_for_lei(context: dict[str, str] | None = None):
-    lei: str | None = context.get("lei", None) if context else None
+    lei: str | None = _get_lei(context)
 
     return {
         "uid": {
@@ -0,0 +1,110 @@
+"""Helpers to run the stages of validating a file (reading chunks, evaluating
+checks, formatting findings) at the same time, rather than one after another.
+
+Each stage is an iterator over the output of the stage before it.  `staged`
+moves a stage onto its own thread, handing its output to the next stage
+through a bounded queue.  When the queue is full the stage waits, so a slow
+downstream stage holds back the stages before it, and no more than the queue
+size of chunks pile up between any two stages."""
+
+from collections import deque
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# how often a waiting stage checks if the pipeline has been closed, in seconds
+_POLL_INTERVAL = 0.1
+
+_END = object()
+
+
+def _close(items: Iterator):
+    if hasattr(items, "close"):
+        items.close()
+
+
+def staged(fn: Callable[[T], R], items: Iterator[T], queue_size: int) -> Iterator[R]:
+    """
+    Like map, but iterates items and applies fn to them on a separate thread, buffering up to
+    queue_size results ahead of the caller.  Exceptions raised by items or fn are re-raised to the
+    caller.  Closing the returned iterator stops the thread, and closes items.
+    Args:
+        fn (Callable): the stage, applied to each item
+        items (Iterator): the output of the previous stage
+        queue_size (int): the number of results that can be buffered, must be at least 1
+    Returns:
+        Iterator over the results, in the same order as items
+    """
+    if queue_size < 1:
+        raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+
+    buffer: Queue = Queue(maxsize=queue_size)
+    stopped = Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((fn(item), None)):
+                    return
+            put((_END, None))
+        except BaseException as err:
+            put((_END, err))
+        finally:
+            _close(items)
+
+    def consume():
+        thread = Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                try:
+                    item, err = buffer.get(timeout=_POLL_INTERVAL)
+                except Empty:
+                    if not thread.is_alive() and buffer.empty():
+                        return
+                    continue
+                if item is _END:
+                    if err is not None:
+                        raise err
+                    return
+                yield item
+        finally:
+            stopped.set()
+            thread.join()
+
+    return consume()
+
+
+def look_ahead(fn: Callable[[T], R], items: Iterator[T], count: int) -> Iterator[R]:
+    """
+    Like map, but on the calling thread, always applying fn to count items ahead of the caller.  Used to
+    keep count tasks submitted to a worker pool while the caller waits on the oldest one.
+    Args:
+        fn (Callable): the stage, applied to each item
+        items (Iterator): the output of the previous stage
+        count (int): how many items to apply fn to ahead of the caller
+    Returns:
+        Iterator over the results, in the same order as items
+    """
+    pending: deque = deque()
+    try:
+        for item in items:
+            pending.append(fn(item))
+            if len(pending) > count:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+    finally:
+        _close(items)
@@ -0,0 +1,108 @@
+"""The uids of a submission, collected a chunk at a time, for the register
+level uniqueness check (E3000).
+
+Only rows whose uid is used more than once can fail the check, so rather than
+holding every uid until the end of the submission and checking the whole
+register at once, the register only keeps the row number and a 64 bit hash of
+each row's uid, never the uids themselves.  Every copy of a uid has the same
+hash, so once the submission has been read, only the rows whose hash repeats
+can be duplicates.  Their uids are then read back from the submission, and the
+rows whose uid actually repeats (rather than only colliding on its hash) are
+the duplicates.
+
+For very large submissions, the hashes can be spilled to disk instead, hash
+partitioned so that every copy of a uid lands in the same partition.  The
+repeated hashes are then found one partition at a time, which bounds the
+memory used to the size of a single partition."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+import polars as pl
+
+
+class UidRegister:
+    def __init__(self, partitions: int = 0):
+        """
+        Args:
+            partitions (int): 0 keeps the uid hashes in memory.  Otherwise, the hashes are partitioned into
+                this many partitions on disk.
+        """
+        self.partitions = partitions
+        self.row_count = 0
+        self._frames: list[pl.DataFrame] = []
+        self._spill_dir: str | None = tempfile.mkdtemp(prefix="uids_") if partitions else None
+        self._chunk_count = 0
+
+    def add(self, uids: pl.Series):
+        """
+        Add the uids of the next chunk of the submission
+        Args:
+            uids (pl.Series): the uid column of the chunk
+        """
+        df = pl.DataFrame(
+            {
+                "row": pl.int_range(self.row_count, self.row_count + uids.len(), dtype=pl.UInt32, eager=True),
+                "hash": uids.hash(),
+            }
+        )
+        self.row_count += uids.len()
+
+        if not self.partitions:
+            self._frames.append(df)
+            return
+
+        partitioned = df.with_columns(partition=pl.col("hash") % self.partitions).partition_by(
+            "partition", as_dict=True, include_key=False
+        )
+        for (partition,), partition_df in partitioned.items():
+            partition_dir = Path(self._spill_dir) / str(partition)
+            partition_dir.mkdir(exist_ok=True)
+            partition_df.write_ipc(partition_dir / f"{self._chunk_count}.arrow")
+        self._chunk_count += 1
+
+    def duplicates(self, uids: Iterable[pl.Series]) -> pl.DataFrame:
+        """
+        Get the rows whose uid is used by another row of the submission
+        Args:
+            uids (Iterable[pl.Series]): the uid columns of the chunks of the submission, in the order they were
+                added.  They are only read up to the last row whose hash repeats, and not at all when no hash does.
+        Returns:
+            pl.DataFrame with the row (offset from the start of the submission) and uid of each duplicated
+            row, in row order
+        """
+        if not self.partitions:
+            frames = [pl.concat(self._frames).filter(pl.col("hash").is_duplicated())] if self._frames else []
+        else:
+            frames = [
+                pl.scan_ipc(partition_dir / "*.arrow").filter(pl.col("hash").is_duplicated()).collect()
+                for partition_dir in Path(self._spill_dir).iterdir()
+            ]
+        rows = pl.concat(frames)["row"].sort() if frames else pl.Series("row", [], dtype=pl.UInt32)
+        if rows.is_empty():
+            return pl.DataFrame(schema={"row": pl.UInt32, "uid": pl.String})
+        return _gather_uids(rows, uids).filter(pl.col("uid").is_duplicated())
+
+    def close(self):
+        self._frames = []
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+
+# the uids of the given (sorted) rows of the submission, read from the uid columns of its chunks
+def _gather_uids(rows: pl.Series, uids: Iterable[pl.Series]) -> pl.DataFrame:
+    frames = []
+    row_start = 0
+    for chunk_uids in uids:
+        row_end = row_start + chunk_uids.len()
+        first, last = rows.search_sorted(row_start, "left"), rows.search_sorted(row_end, "left")
+        chunk_rows = rows.slice(first, last - first)
+        if not chunk_rows.is_empty():
+            frames.append(pl.DataFrame({"row": chunk_rows, "uid": chunk_uids.gather(chunk_rows - row_start)}))
+        row_start = row_end
+        if row_start > rows[-1]:
+            break
+    return pl.concat(frames)
@@ -1,6 +1,6 @@
 import polars as pl
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 
 
@@ -9,6 +9,17 @@ class ValidationPhase(StrEnum):
     LOGICAL = "Logical"
 
 
+# What validate_batch_csv does with the rest of a phase once max_errors findings have been returned
+class MaxErrorsMode(StrEnum):
+    # keep reading the data, but no longer return findings or counts
+    CONTINUE = "continue"
+    # stop reading the data.  The results where validation stopped are marked partial, and the counts for
+    # the phase are lower bounds.
+    STOP = "stop"
+    # keep reading the data, but only count the failures, so the counts for the phase are exact
+    COUNT = "count"
+
+
 # @dataclass(frozen=True)
 @dataclass
 class Counts(object):
@@ -17,6 +28,14 @@ class Counts(object):
     register_count: int = 0
     total_count: int = 0
 
+    def __add__(self, other: "Counts") -> "Counts":
+        return Counts(
+            single_field_count=self.single_field_count + other.single_field_count,
+            multi_field_count=self.multi_field_count + other.multi_field_count,
+            register_count=self.register_count + other.register_count,
+            total_count=self.total_count + other.total_count,
+        )
+
 
 # @dataclass(frozen=True)
 @dataclass
@@ -26,3 +45,10 @@ class ValidationResults(object):
     is_valid: bool
     findings: pl.DataFrame
     phase: ValidationPhase
+    # True when validation stopped before the end of the data, so the counts are lower bounds
+    is_partial: bool = False
+    # number of rows that failed each check, by validation id.  Checks with no failures are left out.
+    check_counts: dict[str, int] = field(default_factory=dict)
+    # running totals of the counts of every result of the submission so far, including this one
+    total_error_counts: Counts = field(default_factory=Counts)
+    total_warning_counts: Counts = field(default_factory=Counts)
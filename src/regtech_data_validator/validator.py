@@ -1,21 +1,45 @@
 """Creates two DataFrameSchema objects by rendering the schema template
 with validations listed in phase 1 and phase 2."""
 
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from threading import Event
+from typing import Callable, Mapping
 import polars as pl
 import pandera.polars as pa
-from pandera import Check
 from pandera.errors import SchemaErrors, SchemaError, SchemaErrorReason
 
 from regtech_data_validator.checks import SBLCheck, Severity
+from regtech_data_validator.chunk_cache import MAX_CACHED_BYTES, ChunkCache
+from regtech_data_validator.engine import (
+    CompiledSchema,
+    PolarsOptions,
+    ValidationEngine,
+    build_findings,
+    cap_failed_rows,
+    count_failures,
+    encode,
+    find_failed_rows,
+    get_check_fields,
+    get_compiled_phase_1_schema_for_lei,
+    get_compiled_phase_2_schema_for_lei,
+    get_compiled_register_schema,
+    normalize,
+    required_columns,
+    select_checks,
+)
 
-from regtech_data_validator.validation_results import ValidationPhase, Counts, ValidationResults
+from regtech_data_validator.validation_results import Counts, MaxErrorsMode, ValidationResults
 from regtech_data_validator.data_formatters import format_findings
+from regtech_data_validator.pipeline import look_ahead, staged
+from regtech_data_validator.uid_register import UidRegister
 
 from fsspec import AbstractFileSystem, filesystem
 
 import shutil
-import os
+import tempfile
 
 from regtech_data_validator.phase_validations import (
     get_phase_1_schema_for_lei,
@@ -24,23 +48,6 @@ from regtech_data_validator.phase_validations import (
 )
 
 
-# Gets all associated field names from the check
-def _get_check_fields(check: Check, primary_column: str) -> list[str]:
-
-    field_list = [primary_column]
-    if "related_fields" in check._check_kwargs:
-        related_fields = check._check_kwargs["related_fields"]
-        if related_fields:
-            # related_fields can be a single str or list of str
-            if isinstance(related_fields, str):
-                field_list.append(related_fields)
-            else:
-                field_list.extend(related_fields)
-    # remove possible dupes but maintain order
-    field_list = list(dict.fromkeys(field_list))
-    return field_list
-
-
 # Retrieves the row data from the original dataframe that threw errors/warnings, and pulls out the fields/values
 # from the original row data that caused the error/warning
 def _filter_valid_records(df: pl.DataFrame, check_output: pl.Series, fields: list[str]) -> pl.DataFrame:
@@ -55,9 +62,9 @@ def _filter_valid_records(df: pl.DataFrame, check_output: pl.Series, fields: lis
 
 
 def _records_to_fields(failed_records_df: pl.DataFrame) -> pl.DataFrame:
-    # Melts the DataFrame with columns per Check field to DataFrame with a row per field
-    failed_record_fields_df = failed_records_df.melt(
-        variable_name='field_name', value_name='field_value', id_vars=['record_no']
+    # Unpivots the DataFrame with columns per Check field to DataFrame with a row per field
+    failed_record_fields_df = failed_records_df.unpivot(
+        index=['record_no'], variable_name='field_name', value_name='field_value'
     )
     return failed_record_fields_df
 
@@ -69,17 +76,21 @@ def _add_validation_metadata(failed_check_fields_df: pl.DataFrame, check: SBLChe
 
 
 def validate(
-    schema: pa.DataFrameSchema, submission_df: pl.LazyFrame, row_start: int, process_errors: bool
+    schema: pa.DataFrameSchema | CompiledSchema, submission_df: pl.LazyFrame, row_start: int, process_errors: bool
 ) -> pl.DataFrame:
     """
     validate received dataframe with schema and return list of
     schema errors
     Args:
-        schema (DataFrameSchema): schema to be used for validation
+        schema (DataFrameSchema | CompiledSchema): schema to be used for validation.  A CompiledSchema
+            is evaluated by the Polars engine instead of Pandera.
         submission_df (pl.DataFrame): data to be validated against the schema
     Returns:
-        pd.DataFrame containing validation results data
+        pl.DataFrame containing the formatted findings, see data_formatters.format_findings
     """
+    if isinstance(schema, CompiledSchema):
+        return validate_compiled(schema, submission_df, row_start, process_errors)
+
     findings_df: pl.DataFrame = pl.DataFrame()
 
     try:
@@ -116,7 +127,7 @@ def validate(
 
                 schema_error = gather_errors(schema_error)
 
-                fields = _get_check_fields(check, column_name)
+                fields = get_check_fields(check, column_name)
                 check_output: pl.Series | None = schema_error.check_output
 
                 if check_output is not None:
@@ -135,9 +146,31 @@ def validate(
                 findings_df = pl.concat(check_findings)
 
     updated_df = add_uid(findings_df, submission_df, row_start)
+    if not updated_df.is_empty():
+        updated_df = format_findings(updated_df, schema.name.value)
     return updated_df
 
 
+def validate_compiled(
+    schema: CompiledSchema, submission_df: pl.DataFrame, row_start: int, process_errors: bool
+) -> pl.DataFrame:
+    """
+    validate received dataframe with the Polars engine, evaluating every check in a single query,
+    and return the same findings the Pandera schema would.  The findings are built directly in
+    their formatted layout from the failed row offsets, without melting and pivoting the fields.
+    Args:
+        schema (CompiledSchema): compiled checks to be used for validation
+        submission_df (pl.DataFrame): data to be validated against the schema
+    Returns:
+        pl.DataFrame containing the formatted findings, see data_formatters.format_findings
+    """
+    if not process_errors:
+        return pl.DataFrame()
+
+    failed_rows = find_failed_rows(schema, submission_df)
+    return build_findings(schema, submission_df, failed_rows, row_start)
+
+
 # Add the uid for the record throwing the error/warning to the error dataframe
 def add_uid(results_df: pl.DataFrame, submission_df: pl.DataFrame, offset: int) -> pl.DataFrame:
     if results_df.is_empty():
@@ -151,59 +184,338 @@ def add_uid(results_df: pl.DataFrame, submission_df: pl.DataFrame, offset: int)
 # This function is a Generator, and will yield the results of each batch of processing, along with the
 # phase (SYNTACTICAL/LOGICAL) that the findings were found.  Callers of this function will want to
 # store or concat each iteration of findings
+#
+# max_errors_mode sets what happens to the rest of a phase once max_errors findings have been returned, see
+# MaxErrorsMode.
+#
+# speculative evaluates the logic checks in the same pass over the data as the syntax checks, rather than in a
+# second pass once the syntax checks have passed, which is faster for submissions without syntax errors.  The
+# logic results are held until the end of the syntax phase, and thrown away if there were any syntax findings,
+# so the results are the same either way.
+#
+# summary only counts the failures of each check, returning the counts by validation id and scope, without
+# ever building the findings.  The findings of the checks of interest can be fetched later by validating the same
+# file again with validation_ids set to those checks, which only evaluates them, and only reads the columns they
+# need (Polars engine only).
+#
+# max_findings_per_check limits the findings returned for each check in a phase, like max_errors limits the
+# findings in total.  The findings past the limit are never built, but are still counted.
+#
+# bitsets evaluates the checks of the enum fields over integer bitsets of their codes, rather than over lists of
+# their values, which is faster for the multi-value fields (Polars engine only).  See bitset_expressions.
+#
+# distinct evaluates the checks that only read one field once for each distinct value of a chunk's column, rather
+# than for every row, which is faster for low cardinality columns like flags and enums (Polars engine only).
+#
+# categorical dictionary-encodes the enum fields as the chunks are read, so the chunks cached between the
+# phases take less memory.  The checks of an encoded field are evaluated once per category, and other checks
+# compare the encoded values directly, without decoding them.  The results are the same (Polars engine only).
+#
+# Each of the results also carries the running totals of the counts of the submission so far, so the counts of
+# the whole submission are those of the last results.
+#
+# register_partitions > 0 spills the uids collected for the register checks to disk, hash partitioned into
+# that many partitions, rather than keeping them in memory.  See uid_register.
 def validate_batch_csv(
     path: Path | str,
     context: dict[str, str] | None = None,
     batch_size: int = 50000,
     batch_count: int = 1,
     max_errors=1000000,
+    engine: ValidationEngine = ValidationEngine.PANDERA,
+    workers: int = 1,
+    queue_size: int = 0,
+    max_cached_bytes: int = MAX_CACHED_BYTES,
+    speculative: bool = False,
+    register_partitions: int = 0,
+    max_errors_mode: MaxErrorsMode = MaxErrorsMode.CONTINUE,
+    summary: bool = False,
+    validation_ids: list[str] | None = None,
+    max_findings_per_check: int | None = None,
+    bitsets: bool = False,
+    distinct: bool = False,
+    categorical: bool = False,
+):
+    polars_options = PolarsOptions(validation_ids, bitsets, distinct, categorical)
+    polars_options.check_engine(engine)
+
+    # each call caches a downloaded S3 file in its own directory, so concurrent validations don't share (or
+    # delete) each other's files
+    cache_storage = tempfile.mkdtemp(prefix="s3_") if str(path).startswith("s3://") else None
+    # the chunks parsed for the syntax phase are kept for the logic phase, so the csv is only parsed once
+    chunk_cache = ChunkCache(max_cached_bytes)
+    uid_register = UidRegister(register_partitions)
+    try:
+        real_path = get_real_file_path(path, cache_storage)
+        total_error_counts, total_warning_counts = Counts(), Counts()
+        for results in _validate_batch_csv(
+            context=context,
+            engine=engine,
+            speculative=speculative,
+            summary=summary,
+            max_findings_per_check=max_findings_per_check,
+            polars_options=polars_options,
+            chunk_cache=chunk_cache,
+            uid_register=uid_register,
+            read_chunks=partial(_read_chunks, real_path, batch_size, batch_count),
+            validate_chunks=partial(
+                _validate_chunks,
+                max_errors=max_errors,
+                workers=workers,
+                queue_size=queue_size,
+                max_errors_mode=max_errors_mode,
+                max_findings_per_check=max_findings_per_check,
+                count_only=summary,
+            ),
+        ):
+            total_error_counts += results.error_counts
+            total_warning_counts += results.warning_counts
+            results.total_error_counts, results.total_warning_counts = total_error_counts, total_warning_counts
+            yield results
+    finally:
+        uid_register.close()
+        chunk_cache.close()
+        if cache_storage:
+            shutil.rmtree(cache_storage, ignore_errors=True)
+
+
+def _validate_batch_csv(
+    *,
+    context: dict[str, str] | None,
+    engine: ValidationEngine,
+    speculative: bool,
+    summary: bool,
+    max_findings_per_check: int | None,
+    polars_options: PolarsOptions,
+    chunk_cache: ChunkCache,
+    uid_register: UidRegister,
+    read_chunks: Callable,
+    validate_chunks: Callable,
 ):
     has_syntax_errors = False
-    real_path = get_real_file_path(path)
     # process the data first looking for syntax (phase 1) errors, then looking for logical (phase 2) errors/warnings
-    syntax_schema = get_phase_1_schema_for_lei(context)
-    syntax_checks = [check for col_schema in syntax_schema.columns.values() for check in col_schema.checks]
+    if engine == ValidationEngine.POLARS:
+        bitsets, distinct = polars_options.bitsets, polars_options.distinct
+        syntax_schema = get_compiled_phase_1_schema_for_lei(context, bitsets, distinct)
+        logic_schema = get_compiled_phase_2_schema_for_lei(context, bitsets, distinct)
+        register_schema = get_compiled_register_schema()
+        validation_ids = polars_options.validation_ids
+        if validation_ids is not None:
+            syntax_schema = select_checks(syntax_schema, validation_ids)
+            logic_schema = select_checks(logic_schema, validation_ids)
+            register_schema = select_checks(register_schema, validation_ids)
+        # the chunks are read once for every phase, so only the columns needed by any of the phases are read
+        columns = list(
+            dict.fromkeys(
+                required_columns(syntax_schema) + required_columns(logic_schema) + required_columns(register_schema)
+            )
+        )
+        # the normalized columns of each phase are added as the chunks are read for it
+        normalized_schemas = [syntax_schema, logic_schema]
+    else:
+        syntax_schema = get_phase_1_schema_for_lei(context)
+        logic_schema = get_phase_2_schema_for_lei(context)
+        register_schema = get_register_schema(context)
+        columns = None
+        normalized_schemas = []
+
+    chunks = read_chunks(columns=columns)
+    if polars_options.categorical:
+        chunks = _encode_chunks(chunks)
+
+    if speculative:
+        # evaluate the logic checks along with the syntax checks, holding on to the logic results until the
+        # syntax checks are known to have passed
+        logic_results = []
+        # set once the logic checks stop at max_errors (see MaxErrorsMode.STOP), after which their results are
+        # dropped, as the two phases would have stopped reading the data there
+        logic_stopped = False
+        for (validation_results, speculative_results), df in validate_chunks(
+            [syntax_schema, logic_schema],
+            _normalize_chunks(normalized_schemas, chunks),
+            speculative=True,
+        ):
+            uid_register.add(df["uid"])
+            if not validation_results.is_valid:
+                has_syntax_errors = True
+                logic_results = []
+            if not (has_syntax_errors or logic_stopped):
+                logic_results.append(speculative_results)
+                logic_stopped = getattr(speculative_results, "is_partial", False)
+            yield validation_results
+    else:
+        # the chunks are cached before they are normalized, so the cache only holds the data as it was read
+        for (validation_results,), df in validate_chunks(
+            [syntax_schema],
+            _normalize_chunks(normalized_schemas[:1], chunk_cache.read_through(chunks)),
+        ):
+            uid_register.add(df["uid"])
+            # counts rather than findings, since findings are left out of summary results
+            if not validation_results.is_valid:
+                has_syntax_errors = True
+            yield validation_results
 
-    logic_schema = get_phase_2_schema_for_lei(context)
-    logic_checks = [check for col_schema in logic_schema.columns.values() for check in col_schema.checks]
+    if not has_syntax_errors:
+        # the register only holds hashes of the uids, so the uids of the rows whose hash repeats are read back,
+        # from the cache, or from the csv when the chunks weren't cached
+        if speculative:
+            uids = (df["uid"] for _, df in read_chunks(columns=["uid"]))
+        else:
+            uids = (df["uid"] for _, df in chunk_cache)
+        duplicates = uid_register.duplicates(uids)
+        if summary and isinstance(register_schema, CompiledSchema):
+            # the findings are left out of summaries, so they are never built
+            results = _count_results(register_schema, count_failures(register_schema, duplicates.select("uid")))
+        else:
+            results = _chunk_results(register_schema, _validate_register(register_schema, duplicates))
+            if summary:
+                results.findings = pl.DataFrame()
+            else:
+                results.findings = _cap_findings(results.findings, None, max_findings_per_check, None)
+        yield results
 
-    all_uids = []
+        if speculative:
+            for validation_results in logic_results:
+                if isinstance(validation_results, Exception):
+                    raise validation_results
+                yield validation_results
+        else:
+            for (validation_results,), _ in validate_chunks(
+                [logic_schema], _normalize_chunks(normalized_schemas[1:], iter(chunk_cache))
+            ):
+                yield validation_results
+
+
+# Only rows with a duplicated uid can fail the register checks, so only those rows are validated against the
+# register schema.  The rows of their findings are then set back to the rows of the submission, from the rows
+# of the duplicates (see UidRegister.duplicates).
+def _validate_register(schema, duplicates: pl.DataFrame) -> pl.DataFrame:
+    findings = validate(schema, duplicates.select("uid"), 0, True)
+    if findings.is_empty():
+        return findings
+
+    rows = duplicates["row"].gather(findings["row"] - 2) + 2
+    return findings.with_columns(rows.cast(findings["row"].dtype).alias("row"))
+
+
+def _chunk_results(schema: pa.DataFrameSchema | CompiledSchema, findings: pl.DataFrame) -> ValidationResults:
+    error_counts, warning_counts = get_scope_counts(findings)
+    return ValidationResults(
+        error_counts=error_counts,
+        warning_counts=warning_counts,
+        is_valid=((error_counts.total_count + warning_counts.total_count) == 0),
+        findings=findings,
+        phase=schema.name,
+        check_counts=dict(findings.group_by("validation_id").len().iter_rows()) if not findings.is_empty() else {},
+    )
 
-    for validation_results, uids in validate_chunks(
-        syntax_schema, real_path, batch_size, batch_count, max_errors, syntax_checks
-    ):
-        all_uids.extend(uids)
-        # validate, and therefore validate_chunks, can return an empty dataframe for findings
-        if not validation_results.findings.is_empty():
-            has_syntax_errors = True
-        yield validation_results
 
-    if not has_syntax_errors:
-        register_schema = get_register_schema(context)
-        validation_results = validate(register_schema, pl.DataFrame({"uid": all_uids}), 0, True)
-        if not validation_results.is_empty():
-            validation_results = format_findings(
-                validation_results,
-                ValidationPhase.LOGICAL.value,
-                [check for col_schema in register_schema.columns.values() for check in col_schema.checks],
-            )
-        error_counts, warning_counts = get_scope_counts(validation_results)
-        results = ValidationResults(
-            error_counts=error_counts,
-            warning_counts=warning_counts,
-            is_valid=((error_counts.total_count + warning_counts.total_count) == 0),
-            findings=validation_results,
-            phase=register_schema.name,
-        )
-        yield results
+# columns limits the columns that are parsed to those that are needed.  Columns that aren't in the file are
+# left out, so that the missing columns are reported by the checks, same as without columns.  The header
+# is read from a lazy scan, which only parses the first line of the file.
+def _read_chunks(path, batch_size, batch_count, columns: list[str] | None = None):
+    if columns is not None:
+        header = pl.scan_csv(path, infer_schema_length=0).collect_schema().names()
+        columns = [c for c in header if c in columns]
+    reader = pl.read_csv_batched(
+        path, infer_schema_length=0, missing_utf8_is_empty_string=True, batch_size=batch_size, columns=columns
+    )
+    row_start = 0
+    batches = reader.next_batches(batch_count)
+    while batches:
+        df = pl.concat(batches)
+        yield row_start, df
+        row_start += df.height
+        batches = reader.next_batches(batch_count)
+
+
+def _encode_chunks(chunks):
+    for row_start, df in chunks:
+        yield row_start, encode(df)
 
-        for validation_results, _ in validate_chunks(
-            logic_schema, real_path, batch_size, batch_count, max_errors, logic_checks
-        ):
-            yield validation_results
 
-    if os.path.isdir("/tmp/s3"):
-        shutil.rmtree("/tmp/s3")
+def _normalize_chunks(schemas: list[CompiledSchema], chunks):
+    for row_start, df in chunks:
+        yield row_start, normalize(schemas, df) if schemas else df
+
+
+def _count_results(schema: CompiledSchema, failure_counts: dict[str, int]) -> ValidationResults:
+    scope_counts = Counter()
+    for c in schema.checks:
+        scope_counts[(c.check.severity, c.check.scope)] += failure_counts[c.id]
+    error_counts, warning_counts = _severity_counts(scope_counts)
+    return ValidationResults(
+        error_counts=error_counts,
+        warning_counts=warning_counts,
+        is_valid=((error_counts.total_count + warning_counts.total_count) == 0),
+        findings=pl.DataFrame(),
+        phase=schema.name,
+        check_counts={check_id: count for check_id, count in failure_counts.items() if count},
+    )
+
+
+# The Polars engine evaluates the checks and formats the findings separately, so that the two can be
+# pipelined.  Pandera does both at once, while evaluating the checks.  With count_only, the Polars engine only
+# counts the failed rows, Pandera has no cheaper way to count them, so still builds the findings.
+def _evaluate_chunk(schema, df: pl.DataFrame, row_start: int, process_errors: bool, count_only: bool = False):
+    if isinstance(schema, CompiledSchema):
+        if count_only:
+            return count_failures(schema, df)
+        return find_failed_rows(schema, df) if process_errors else None
+    return validate(schema, df, row_start, process_errors or count_only)
+
+
+# The counts of the results are always for every failure, but only the findings within max_findings (in total)
+# and max_findings_per_check (by validation id) are returned.  The Polars engine never builds the findings past
+# the caps, Pandera has already built them, so they are dropped.
+def _format_chunk(
+    schema,
+    df: pl.DataFrame,
+    row_start: int,
+    evaluated,
+    count_only: bool = False,
+    max_findings: int | None = None,
+    max_findings_per_check: int | None = None,
+    kept_per_check: Mapping[str, int] | None = None,
+) -> ValidationResults:
+    if isinstance(schema, CompiledSchema):
+        if count_only:
+            return _count_results(schema, evaluated)
+        if evaluated is None:
+            return _chunk_results(schema, pl.DataFrame())
+        results = _count_results(schema, {check_id: rows.len() for check_id, rows in evaluated.items()})
+        failed_rows = cap_failed_rows(evaluated, max_findings, max_findings_per_check, kept_per_check)
+        # the findings have the field columns of every failed check, as they would without the caps
+        field_count = max((len(c.fields) for c in schema.checks if not evaluated[c.id].is_empty()), default=0)
+        results.findings = build_findings(schema, df, failed_rows, row_start, field_count)
+        return results
+
+    results = _chunk_results(schema, evaluated)
+    if count_only:
+        results.findings = pl.DataFrame()
+    else:
+        results.findings = _cap_findings(results.findings, max_findings, max_findings_per_check, kept_per_check)
+    return results
+
+
+def _cap_findings(
+    findings: pl.DataFrame,
+    max_findings: int | None,
+    max_findings_per_check: int | None,
+    kept_per_check: Mapping[str, int] | None,
+) -> pl.DataFrame:
+    if findings.is_empty():
+        return findings
+    if max_findings_per_check is not None:
+        # findings are sorted by validation id, then row, so this keeps the first findings of each check
+        findings = findings.filter(
+            pl.int_range(pl.len()).over("validation_id")
+            < max_findings_per_check
+            - pl.col("validation_id").replace_strict(kept_per_check or {}, default=0, return_dtype=pl.Int64)
+        )
+    if max_findings is not None:
+        findings = findings.head(max_findings)
+    return findings
 
 
 # Reads in a path to a csv in batches, using batch_size to determine number of rows to read into the buffer,
@@ -211,44 +523,198 @@ def validate_batch_csv(
 # shows 50K batch_size with 1 batch_count to be a nice balance of speed and resource utilization.  Increasing
 # these increases resource utilization but increases speed (especially batch_count).  Reducing these, espectially
 # batch_count adds processing cylces (time) but can significantly reduce resources.
-def validate_chunks(schema, path, batch_size, batch_count, max_errors, checks):
-    reader = pl.read_csv_batched(path, infer_schema_length=0, missing_utf8_is_empty_string=True, batch_size=batch_size)
-    batches = reader.next_batches(batch_count)
-    process_errors = True
-    total_count = 0
-    row_start = 0
-    while batches:
-        df = pl.concat(batches)
-        validation_results = validate(schema, df, row_start, process_errors)
-        if not validation_results.is_empty():
-
-            validation_results = format_findings(validation_results, schema.name.value, checks)
-
-        error_counts, warning_counts = get_scope_counts(validation_results)
-        results = ValidationResults(
-            error_counts=error_counts,
-            warning_counts=warning_counts,
-            is_valid=((error_counts.total_count + warning_counts.total_count) == 0),
-            findings=validation_results,
-            phase=schema.name,
-        )
+#
+# workers sets how many chunks are validated at once, each on its own thread.  Chunks are still read, and
+# their results yielded, in row order, so row offsets and max_errors truncation are the same as validating
+# the chunks one at a time.
+#
+# queue_size > 0 runs reading the csv, evaluating the checks and formatting the findings as separate stages,
+# each on its own thread, so reading and formatting the next chunks overlaps with evaluating the current one.
+# The stages are connected by queues holding at most queue_size chunks, which caps the memory used no matter
+# how far ahead the reader could get.  queue_size 0 runs every stage on the calling thread.
+#
+# chunks can be given as (row_start, df) for chunks that have already been read, in which case path is not read.
+def validate_chunks(
+    schema,
+    path,
+    batch_size,
+    batch_count,
+    max_errors,
+    workers: int = 1,
+    queue_size: int = 0,
+    chunks=None,
+    max_errors_mode: MaxErrorsMode = MaxErrorsMode.CONTINUE,
+    max_findings_per_check: int | None = None,
+):
+    if chunks is None:
+        columns = required_columns(schema) if isinstance(schema, CompiledSchema) else None
+        chunks = _read_chunks(path, batch_size, batch_count, columns)
+    for (results,), df in _validate_chunks(
+        [schema], chunks, max_errors, workers, queue_size, max_errors_mode, max_findings_per_check
+    ):
+        yield results, df["uid"]
 
-        total_count += results.findings.height
 
-        if total_count > max_errors and process_errors:
-            process_errors = False
-            head_count = results.findings.height - (total_count - max_errors)
-            results.findings = results.findings.head(head_count)
+# Python functions called by Polars run on its thread pool and need the GIL, while eager Polars calls on other
+# threads hold the GIL waiting on that same pool, so the two can deadlock.  Pandera schemas, and compiled
+# schemas with checks that run Python, are never evaluated alongside other threads.
+def _runs_python(schema) -> bool:
+    return not isinstance(schema, CompiledSchema) or schema.runs_python
 
-        row_start += df.height
-        batches = reader.next_batches(batch_count)
-        yield results, df["uid"].to_list()
 
+def _run_now(fn, *args) -> Future:
+    # stands in for executor.submit, running fn on the calling thread
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as err:
+        future.set_exception(err)
+    return future
+
+
+# Validates each chunk against every schema, in one pass over the chunks, yielding the results for each schema
+# along with the chunk.  max_errors, and max_findings_per_check, are applied to each schema separately.  Both only
+# limit the findings returned, the counts are always for every failure (until max_errors is reached, see
+# MaxErrorsMode).
+#
+# With speculative, the results of every schema after the first are only wanted if the first schema finds
+# nothing, in the same way the logic checks are only run on syntactically valid data.  Once the first schema
+# has findings, the others are no longer validated for errors, and an error raised validating a chunk against
+# them is returned in place of their results rather than raised.
+#
+# When any schema runs Python (see _runs_python), workers and queue_size are ignored, and every stage runs on
+# the calling thread, one chunk at a time.
+def _validate_chunks(
+    schemas,
+    chunks,
+    max_errors,
+    workers,
+    queue_size,
+    max_errors_mode: MaxErrorsMode = MaxErrorsMode.CONTINUE,
+    max_findings_per_check: int | None = None,
+    speculative=False,
+    count_only=False,
+):
+    # set once max_errors is reached for a schema, after which the remaining chunks are no longer validated
+    # for errors against it
+    errors_maxed = [Event() for _ in schemas]
+    # with speculative, set once the first schema has findings, after which the other schemas are no longer
+    # validated, not even counted
+    discarded = Event()
+    serial = any(_runs_python(schema) for schema in schemas)
+    if serial:
+        workers, queue_size = 1, 0
+    executor = ThreadPoolExecutor(max_workers=workers)
+    submit = _run_now if serial else executor.submit
+
+    def evaluate(chunk):
+        row_start, df = chunk
+        wanted = [not (speculative and schema_number and discarded.is_set()) for schema_number in range(len(schemas))]
+        schema_count_only = [
+            is_wanted and (count_only or (maxed.is_set() and max_errors_mode == MaxErrorsMode.COUNT))
+            for is_wanted, maxed in zip(wanted, errors_maxed)
+        ]
+        futures = [
+            submit(_evaluate_chunk, schema, df, row_start, is_wanted and not maxed.is_set(), only_count)
+            for schema, maxed, is_wanted, only_count in zip(schemas, errors_maxed, wanted, schema_count_only)
+        ]
+        return row_start, df, futures, schema_count_only
+
+    # Chunks are formatted one at a time, in row order, so the findings that fit within the caps are known
+    # when the chunk is formatted, and only those are built.
+    failures_formatted = [0 for _ in schemas]
+    findings_per_check = [Counter() for _ in schemas]
+
+    def format_results(chunk):
+        row_start, df, futures, schema_count_only = chunk
+        all_results = []
+        for schema_number, (schema, future) in enumerate(zip(schemas, futures)):
+            try:
+                results = _format_chunk(
+                    schema,
+                    df,
+                    row_start,
+                    future.result(),
+                    schema_count_only[schema_number],
+                    max(max_errors - failures_formatted[schema_number], 0),
+                    max_findings_per_check,
+                    findings_per_check[schema_number],
+                )
+            except Exception as err:
+                if not (speculative and schema_number):
+                    raise
+                all_results.append(err)
+                continue
+
+            failures_formatted[schema_number] += results.error_counts.total_count + results.warning_counts.total_count
+            if not results.findings.is_empty():
+                findings_per_check[schema_number].update(
+                    dict(results.findings["validation_id"].value_counts().iter_rows())
+                )
+            all_results.append(results)
+        return all_results, df
+
+    if queue_size:
+        chunks = staged(lambda chunk: chunk, chunks, queue_size)
+        # keep every worker busy, even if the queue is smaller than the pool
+        evaluated = staged(evaluate, chunks, max(queue_size, workers))
+        formatted = staged(format_results, evaluated, queue_size)
+    else:
+        formatted = map(format_results, look_ahead(evaluate, chunks, workers - 1))
 
-def get_real_file_path(path):
+    process_errors = [True for _ in schemas]
+    total_counts = [0 for _ in schemas]
+    try:
+        for all_results, df in formatted:
+            for schema_number, (schema, results) in enumerate(zip(schemas, all_results)):
+                # max_errors doesn't apply to summaries, which have no findings
+                if isinstance(results, Exception) or count_only:
+                    continue
+
+                # the chunk may have been submitted before an earlier chunk reached max_errors
+                if not process_errors[schema_number]:
+                    if max_errors_mode == MaxErrorsMode.COUNT:
+                        results.findings = pl.DataFrame()
+                    else:
+                        results = all_results[schema_number] = _chunk_results(schema, pl.DataFrame())
+
+                failures = results.error_counts.total_count + results.warning_counts.total_count
+                if total_counts[schema_number] + failures > max_errors and process_errors[schema_number]:
+                    process_errors[schema_number] = False
+                    errors_maxed[schema_number].set()
+                    # the findings were already capped when they were built, this only guards the total
+                    results.findings = results.findings.head(max_errors - total_counts[schema_number])
+                    # the data is still read for the first schema, so the caller drops the results of the other
+                    # schemas after this one, as if the data had stopped here for them
+                    if speculative and schema_number and max_errors_mode == MaxErrorsMode.STOP:
+                        results.is_partial = True
+                total_counts[schema_number] += failures
+
+            if speculative and not all_results[0].is_valid:
+                discarded.set()
+
+            # once every schema whose results are wanted has reached max_errors, stop reading the rest of the data
+            all_maxed = not process_errors[0] if speculative else not any(process_errors)
+            if max_errors_mode == MaxErrorsMode.STOP and all_maxed:
+                for results in all_results:
+                    if not isinstance(results, Exception):
+                        results.is_partial = True
+                yield all_results, df
+                return
+
+            yield all_results, df
+    finally:
+        if queue_size:
+            formatted.close()
+        executor.shutdown(cancel_futures=True)
+
+
+def get_real_file_path(path, cache_storage: str | None = None):
     path = str(path)
     if path.startswith("s3://"):
-        fs: AbstractFileSystem = filesystem(protocol="filecache", target_protocol="s3", cache_storage="/tmp/s3")
+        fs: AbstractFileSystem = filesystem(
+            protocol="filecache", target_protocol="s3", cache_storage=cache_storage or "/tmp/s3"
+        )
         path = fs.unstrip_protocol(path)
         with fs.open(path, "r") as f:
             return f.name
@@ -258,40 +724,32 @@ def get_real_file_path(path):
 # This function adds an index column (polars dataframes do not normally have one), and filters out
 # any row that did not fail a check.
 def gather_errors(schema_error: SchemaError):
-    schema_error.check_output = schema_error.check_output.with_row_index()
-    error_indices = schema_error.check_output.filter(~pl.col("check_output"))["index"].to_list()
-    schema_error.check_output = schema_error.check_output.filter(pl.col("index").is_in(error_indices))
+    schema_error.check_output = schema_error.check_output.with_row_index().filter(~pl.col("check_output"))
     return schema_error
 
 
 def get_scope_counts(error_frame: pl.DataFrame):
-    if not error_frame.is_empty():
-        single_errors = error_frame.filter(
-            (pl.col("validation_type") == Severity.ERROR) & (pl.col("scope") == "single-field")
-        ).height
-        single_warnings = error_frame.filter(
-            (pl.col("validation_type") == Severity.WARNING) & (pl.col("scope") == "single-field")
-        ).height
-        register_errors = error_frame.filter(
-            (pl.col("validation_type") == Severity.ERROR) & (pl.col("scope") == "register")
-        ).height
-        multi_errors = error_frame.filter(
-            (pl.col("validation_type") == Severity.ERROR) & (pl.col("scope") == "multi-field")
-        ).height
-        multi_warnings = error_frame.filter(
-            (pl.col("validation_type") == Severity.WARNING) & (pl.col("scope") == "multi-field")
-        ).height
-
-        return Counts(
-            single_field_count=single_errors,
-            multi_field_count=multi_errors,
-            register_count=register_errors,
-            total_count=sum([single_errors, multi_errors, register_errors]),
-        ), Counts(
-            single_field_count=single_warnings,
-            multi_field_count=multi_warnings,
-            total_count=sum([single_warnings, multi_warnings]),  # There are no register-level warnings at this time
-        )
-
-    else:
+    if error_frame.is_empty():
         return Counts(), Counts()
+    # one pass over the findings, counting them by severity and scope
+    scope_counts = error_frame.group_by("validation_type", "scope").len().iter_rows()
+    return _severity_counts({(severity, scope): count for severity, scope, count in scope_counts})
+
+
+def _severity_counts(scope_counts: dict[tuple[str, str], int]) -> tuple[Counts, Counts]:
+    single_errors = scope_counts.get((Severity.ERROR, "single-field"), 0)
+    multi_errors = scope_counts.get((Severity.ERROR, "multi-field"), 0)
+    register_errors = scope_counts.get((Severity.ERROR, "register"), 0)
+    single_warnings = scope_counts.get((Severity.WARNING, "single-field"), 0)
+    multi_warnings = scope_counts.get((Severity.WARNING, "multi-field"), 0)
+
+    return Counts(
+        single_field_count=single_errors,
+        multi_field_count=multi_errors,
+        register_count=register_errors,
+        total_count=sum([single_errors, multi_errors, register_errors]),
+    ), Counts(
+        single_field_count=single_warnings,
+        multi_field_count=multi_warnings,
+        total_count=sum([single_warnings, multi_warnings]),  # There are no register-level warnings at this time
+    )
@@ -0,0 +1,24 @@
+from regtech_data_validator.validation_results import ValidationResults
+
+
+def assert_same_results(
+    expected: list[ValidationResults], actual: list[ValidationResults], *, counts: bool = True, findings: bool = True
+):
+    """
+    Assert that two validations of the same submission yielded the same results, chunk by chunk.
+    Args:
+        expected (list[ValidationResults]): the results to compare against
+        actual (list[ValidationResults]): the results being checked
+        counts (bool): whether the error, warning and check counts, and so is_valid, have to match
+        findings (bool): whether the findings have to match
+    """
+    assert len(actual) == len(expected)
+    for expected_results, actual_results in zip(expected, actual):
+        assert actual_results.phase == expected_results.phase
+        if counts:
+            assert actual_results.error_counts == expected_results.error_counts
+            assert actual_results.warning_counts == expected_results.warning_counts
+            assert actual_results.check_counts == expected_results.check_counts
+            assert actual_results.is_valid == expected_results.is_valid
+        if findings:
+            assert actual_results.findings.equals(expected_results.findings)
@@ -1,5 +1,6 @@
 import polars as pl
 import pandera.polars as pa
+from pandera.api.function_dispatch import Dispatcher
 
 from regtech_data_validator import global_data
 from regtech_data_validator.check_functions import (
@@ -22,6 +23,7 @@ from regtech_data_validator.check_functions import (
     meets_multi_value_field_restriction,
     string_contains,
 )
+from regtech_data_validator.phase_validations import get_phase_1_schema_for_lei, get_phase_2_schema_for_lei
 
 
 class TestInvalidDateFormat:
@@ -955,3 +957,28 @@ class TestIsValidId:
             )
             is False
         )
+
+
+class TestLazyChecks:
+    def test_checks_do_not_collect(self, monkeypatch):
+        lf = pl.read_csv(
+            "./tests/data/all_logic_errors.csv", infer_schema_length=0, missing_utf8_is_empty_string=True
+        ).lazy()
+
+        def collect(*args, **kwargs):
+            raise AssertionError("check function collected its lazyframe")
+
+        checks = [
+            (column_name, check)
+            for schema in (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei())
+            for column_name, column in schema.columns.items()
+            for check in column.checks
+            # element-wise checks are run on each value, and Pandera's built-in checks are its own
+            if not check.element_wise and not isinstance(check._check_fn, Dispatcher)
+        ]
+        assert checks
+
+        monkeypatch.setattr(pl.LazyFrame, "collect", collect)
+        for column_name, check in checks:
+            results = check._check_fn(pa.PolarsData(lf, column_name), **check._check_kwargs)
+            assert isinstance(results, pl.LazyFrame), check.title
@@ -0,0 +1,70 @@
+import polars as pl
+import pytest
+
+from regtech_data_validator.check_registry import get_check_registry
+from regtech_data_validator.phase_validations import (
+    get_phase_1_schema_for_lei,
+    get_phase_2_schema_for_lei,
+    get_register_schema,
+)
+from regtech_data_validator.validation_results import ValidationPhase
+
+
+class TestCheckRegistry:
+    registry = get_check_registry()
+
+    def test_built_once(self):
+        assert get_check_registry() is self.registry
+
+    def test_get_by_id(self):
+        check = self.registry.get("E3000")
+
+        assert check.title == "E3000"
+        assert check.name == "uid.duplicates_in_dataset"
+        assert check.scope == "register"
+
+    def test_phase_views_match_schemas(self):
+        syntax_schema = get_phase_1_schema_for_lei()
+        logic_schema = get_phase_2_schema_for_lei()
+        register_schema = get_register_schema()
+
+        syntax_checks = [check.title for col_schema in syntax_schema.columns.values() for check in col_schema.checks]
+        logic_checks = [check.title for col_schema in logic_schema.columns.values() for check in col_schema.checks]
+        logic_checks.extend(
+            [check.title for col_schema in register_schema.columns.values() for check in col_schema.checks]
+        )
+
+        assert [check.title for check in self.registry.for_phase(ValidationPhase.SYNTACTICAL)] == syntax_checks
+        assert [check.title for check in self.registry.for_phase(ValidationPhase.LOGICAL)] == logic_checks
+
+    def test_column_view(self):
+        assert [check.title for check in self.registry.for_column("uid")] == ["E0001", "E0002", "W0003", "E3000"]
+        assert self.registry.for_column("not_a_column") == ()
+
+    def test_metadata(self):
+        metadata = self.registry.metadata
+
+        assert metadata.columns == [
+            "validation_id",
+            "validation_name",
+            "validation_description",
+            "fig_link",
+            "validation_type",
+            "scope",
+        ]
+        assert metadata.height == len(self.registry.checks)
+        assert metadata["validation_id"].is_unique().all()
+
+        row = metadata.row(by_predicate=pl.col("validation_id") == "W0003", named=True)
+        check = self.registry.get("W0003")
+        assert row["validation_name"] == check.name
+        assert row["validation_description"] == check.description
+        assert row["fig_link"] == check.fig_link
+        assert row["validation_type"] == "Warning"
+        assert row["scope"] == "single-field"
+
+    def test_immutable(self):
+        with pytest.raises(TypeError):
+            self.registry.checks["E0001"] = None
+        with pytest.raises(AttributeError):
+            self.registry.metadata = None
@@ -0,0 +1,103 @@
+import os
+
+import polars as pl
+import pytest
+
+from regtech_data_validator import validator
+from regtech_data_validator.check_expressions import is_normalized_column
+from regtech_data_validator.chunk_cache import ChunkCache, chunk_size
+from regtech_data_validator.engine import ValidationEngine
+from regtech_data_validator.validator import validate_batch_csv
+
+from tests.conftest import assert_same_results
+
+ALL_LOGIC_ERRORS = "./tests/data/all_logic_errors.csv"
+
+
+def chunks():
+    df = pl.read_csv(ALL_LOGIC_ERRORS, infer_schema_length=0, missing_utf8_is_empty_string=True)
+    return [(row_start, df.slice(row_start, 2)) for row_start in range(0, df.height, 2)]
+
+
+class TestChunkCache:
+    def test_in_memory(self):
+        cache = ChunkCache()
+        expected = chunks()
+
+        assert [c for c in cache.read_through(iter(expected))] == expected
+        assert not cache.spilled
+        assert cache.cached_bytes == sum(chunk_size(df) for _, df in expected)
+        for (row_start, df), (expected_start, expected_df) in zip(cache, expected):
+            assert row_start == expected_start
+            assert df is expected_df
+
+    def test_spills_to_disk(self):
+        expected = chunks()
+        # room for the first chunk only
+        cache = ChunkCache(max_cached_bytes=chunk_size(expected[0][1]))
+        list(cache.read_through(iter(expected)))
+
+        assert cache.spilled
+        spill_dir = cache._spill_dir
+        assert len(os.listdir(spill_dir)) == len(expected) - 1
+        cached = list(cache)
+        assert [row_start for row_start, _ in cached] == [row_start for row_start, _ in expected]
+        for (_, df), (_, expected_df) in zip(cached, expected):
+            assert df.equals(expected_df)
+
+        cache.close()
+        assert not os.path.exists(spill_dir)
+
+    def test_size_counts_buffers(self):
+        # 1000 Int64 values without nulls are held in a single 8000 byte buffer
+        assert chunk_size(pl.DataFrame({"a": pl.int_range(1000, dtype=pl.Int64, eager=True)})) == 8000
+
+        df = chunks()[0][1]
+        assert chunk_size(df) >= df.estimated_size()
+        assert chunk_size(df) == df.to_arrow(compat_level=pl.CompatLevel.newest()).get_total_buffer_size()
+
+    def test_read_before_complete(self):
+        cache = ChunkCache()
+        read = cache.read_through(iter(chunks()))
+        next(read)
+
+        with pytest.raises(RuntimeError):
+            list(cache)
+
+    def test_csv_read_once(self, monkeypatch):
+        reads = []
+        read_csv_batched = pl.read_csv_batched
+
+        def counting_read_csv_batched(*args, **kwargs):
+            reads.append(args[0])
+            return read_csv_batched(*args, **kwargs)
+
+        monkeypatch.setattr(validator.pl, "read_csv_batched", counting_read_csv_batched)
+        results = list(validate_batch_csv(ALL_LOGIC_ERRORS, batch_size=7))
+
+        assert [r.phase for r in results][-1] == "Logical"
+        assert reads == [ALL_LOGIC_ERRORS]
+
+    @pytest.mark.parametrize("max_cached_bytes", [0, 2000])
+    def test_same_results_when_spilled(self, max_cached_bytes):
+        expected = list(validate_batch_csv(ALL_LOGIC_ERRORS, batch_size=7))
+        actual = list(validate_batch_csv(ALL_LOGIC_ERRORS, batch_size=7, max_cached_bytes=max_cached_bytes))
+
+        assert_same_results(expected, actual)
+
+    @pytest.mark.parametrize("categorical", [False, True])
+    def test_normalized_columns_not_cached(self, monkeypatch, categorical):
+        cached_columns = set()
+
+        class RecordingChunkCache(ChunkCache):
+            def append(self, row_start, df):
+                cached_columns.update(df.columns)
+                super().append(row_start, df)
+
+        monkeypatch.setattr(validator, "ChunkCache", RecordingChunkCache)
+        results = list(
+            validate_batch_csv(ALL_LOGIC_ERRORS, batch_size=7, engine=ValidationEngine.POLARS, categorical=categorical)
+        )
+
+        assert [r.phase for r in results][-1] == "Logical"
+        assert cached_columns and not any(map(is_normalized_column, cached_columns))
@@ -0,0 +1,499 @@
+import random
+
+import polars as pl
+import pytest
+from pandera.polars import Column, DataFrameSchema
+
+from regtech_data_validator import check_expressions, check_functions, engine, global_data
+from regtech_data_validator.checks import SBLCheck, Severity
+from regtech_data_validator.engine import (
+    BITSET_BUILDERS,
+    EXPRESSION_BUILDERS,
+    PolarsOptions,
+    ValidationEngine,
+    cap_failed_rows,
+    compile_check,
+    compile_schema,
+    count_failures,
+    decode,
+    encode,
+    enum_codes,
+    evaluate_checks,
+    find_failed_rows,
+    normalize,
+    required_columns,
+    select_checks,
+)
+from regtech_data_validator.phase_validations import (
+    get_phase_1_schema_for_lei,
+    get_phase_2_schema_for_lei,
+    get_register_schema,
+)
+from regtech_data_validator.validator import validate_batch_csv
+
+from tests.conftest import assert_same_results
+
+GOOD_FILE_PATH = "./tests/data/sblar_no_findings.csv"
+ALL_SYNTAX_ERRORS = "./tests/data/all_syntax_errors.csv"
+ALL_LOGIC_ERRORS = "./tests/data/all_logic_errors.csv"
+ALL_LOGIC_WARNINGS = "./tests/data/all_logic_warnings.csv"
+
+
+class TestCompiledEngine:
+
+    def test_compile_schema(self):
+        schema = get_phase_1_schema_for_lei()
+        compiled = compile_schema(schema)
+
+        assert compiled.name == schema.name
+        assert compiled.columns == list(schema.columns.keys())
+        assert [c.id for c in compiled.checks] == [
+            check.title for col_schema in schema.columns.values() for check in col_schema.checks
+        ]
+        assert all(c.expr is not None for c in compiled.checks)
+
+    def test_evaluate_checks_one_column_per_check(self):
+        compiled = compile_schema(get_phase_2_schema_for_lei())
+        df = pl.read_csv(ALL_LOGIC_ERRORS, infer_schema_length=0, missing_utf8_is_empty_string=True)
+        results = evaluate_checks(compiled, df)
+
+        assert results.columns == [c.id for c in compiled.checks]
+        assert results.height == df.height
+        assert all(dtype == pl.Boolean for dtype in results.dtypes)
+
+    def test_find_failed_rows(self):
+        compiled = compile_schema(get_phase_2_schema_for_lei({"lei": "000TESTFIUIDDONOTUS1"}))
+        df = pl.read_csv(GOOD_FILE_PATH, infer_schema_length=0, missing_utf8_is_empty_string=True)
+        failed_rows = find_failed_rows(compiled, df)
+
+        assert list(failed_rows.keys()) == [c.id for c in compiled.checks]
+        assert all(rows.dtype == pl.UInt32 for rows in failed_rows.values())
+        # every uid in the file starts with a different LEI
+        assert failed_rows["W0003"].to_list() == list(range(df.height))
+        assert all(rows.is_empty() for check_id, rows in failed_rows.items() if check_id != "W0003")
+
+    def test_count_failures(self):
+        compiled = compile_schema(get_phase_2_schema_for_lei())
+        df = pl.read_csv(ALL_LOGIC_ERRORS, infer_schema_length=0, missing_utf8_is_empty_string=True)
+        failure_counts = count_failures(compiled, df)
+
+        assert failure_counts == {check_id: rows.len() for check_id, rows in find_failed_rows(compiled, df).items()}
+        assert sum(failure_counts.values()) > 0
+
+    def test_cap_failed_rows(self):
+        failed_rows = {
+            "E0100": pl.Series([0, 1, 2], dtype=pl.UInt32),
+            "E0001": pl.Series([3, 4], dtype=pl.UInt32),
+            "W0002": pl.Series([5, 6, 7], dtype=pl.UInt32),
+        }
+
+        assert cap_failed_rows(failed_rows) == failed_rows
+        capped = cap_failed_rows(failed_rows, max_findings=4, max_findings_per_check=2, kept_per_check={"E0001": 1})
+        assert {check_id: rows.to_list() for check_id, rows in capped.items()} == {
+            "E0001": [3],
+            "E0100": [0, 1],
+            "W0002": [5],
+        }
+
+    def test_required_columns(self):
+        logic_schema = compile_schema(get_phase_2_schema_for_lei())
+        assert required_columns(compile_schema(get_register_schema())) == ["uid"]
+        assert set(required_columns(logic_schema)) == set(logic_schema.columns)
+
+        selected = select_checks(logic_schema, ["E2000"])
+        assert required_columns(selected) == ["uid", "ct_credit_product_ff", "ct_credit_product"]
+        assert len(required_columns(selected)) < len(logic_schema.columns)
+
+    def test_normalize(self):
+        syntax_schema = compile_schema(get_phase_1_schema_for_lei())
+        logic_schema = compile_schema(get_phase_2_schema_for_lei())
+        df = pl.read_csv(ALL_LOGIC_ERRORS, infer_schema_length=0, missing_utf8_is_empty_string=True)
+        normalized = normalize([syntax_schema, logic_schema], df)
+
+        added = [column for column in normalized.columns if column not in df.columns]
+        assert "app_date:date" in added and "ct_credit_product:split:;" in added and "ct_guarantee_ff:blank" in added
+        assert normalized.select(df.columns).equals(df)
+        assert normalize([syntax_schema, logic_schema], normalized) is normalized
+        # the same results whether the checks normalize the data themselves, or it was normalized beforehand
+        for schema in (syntax_schema, logic_schema):
+            assert evaluate_checks(schema, normalized).equals(evaluate_checks(schema, df))
+
+    @pytest.mark.parametrize("bitsets", [False, True])
+    def test_no_python_functions(self, bitsets):
+        # Python functions run on the Polars thread pool need the GIL, which can deadlock chunks evaluated at once
+        for schema in (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei(), get_register_schema()):
+            compiled_schema = compile_schema(schema, bitsets, distinct=True)
+            assert not compiled_schema.runs_python
+            for compiled in compiled_schema.checks:
+                exprs = [compiled.expr, *map(check_expressions.normalized_column, compiled.normalized)]
+                assert not any("python_udf" in str(expr) or "map_list" in str(expr) for expr in exprs), compiled.id
+
+    def test_runs_python(self):
+        check = SBLCheck(
+            lambda value: value == "1",
+            id="E0001",
+            name="python",
+            description="",
+            severity=Severity.ERROR,
+            fig_link="",
+            scope="single-field",
+            element_wise=True,
+        )
+        # a check function without an expression equivalent is run on each value
+        assert compile_check(check, "action_taken").runs_python
+        schema = compile_schema(DataFrameSchema({"action_taken": Column(pl.String, checks=[check])}, name="test"))
+        assert schema.runs_python
+
+    def test_checks_read_normalized_columns(self):
+        for schema in (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei()):
+            for compiled in compile_schema(schema).checks:
+                if compiled.expr is not None and not compiled.check.element_wise:
+                    assert "strptime" not in str(compiled.expr)
+                    assert "str.split" not in str(compiled.expr)
+
+    def test_missing_column(self):
+        compiled = compile_schema(get_phase_1_schema_for_lei())
+        with pytest.raises(RuntimeError) as re:
+            evaluate_checks(compiled, pl.DataFrame({"app_date": ["20241201"]}))
+        assert "column 'uid' not in dataframe" in str(re.value)
+
+    @pytest.mark.parametrize(
+        "path,context,batch_size",
+        [
+            (GOOD_FILE_PATH, {"lei": "000TESTFIUIDDONOTUS1"}, 50000),
+            (ALL_SYNTAX_ERRORS, None, 50000),
+            (ALL_SYNTAX_ERRORS, None, 7),
+            (ALL_LOGIC_ERRORS, None, 50000),
+            (ALL_LOGIC_ERRORS, None, 7),
+            (ALL_LOGIC_WARNINGS, {"lei": "000TESTFIUIDDONOTUSE"}, 50000),
+        ],
+    )
+    def test_same_findings_as_pandera(self, path, context, batch_size):
+        pandera_results = list(
+            validate_batch_csv(path, context, batch_size=batch_size, engine=ValidationEngine.PANDERA)
+        )
+        polars_results = list(validate_batch_csv(path, context, batch_size=batch_size, engine=ValidationEngine.POLARS))
+
+        assert_same_results(pandera_results, polars_results)
+
+
+class TestVectorizedNumericChecks:
+    values = [
+        "1",
+        "-1",
+        "+1.5",
+        "0",
+        "-0",
+        "0010",
+        ".5",
+        "5.",
+        ".",
+        "1.0",
+        "1e5",
+        "1E-5",
+        "1e",
+        "e5",
+        "1.2.3",
+        "1,000",
+        "1_000",
+        "1_000.5_5",
+        "1__0",
+        "_1",
+        "1_",
+        "1e1_0",
+        "nan",
+        "NaN",
+        "-nan",
+        "inf",
+        "-Infinity",
+        "infinity1",
+        "0x10",
+        "abc",
+        "",
+        " ",
+        " 1 ",
+        "\t1\n",
+        "1 2",
+        "\xa01　",
+        "\x1c",
+        "\x1c1",
+        "١٢",
+        "１.5",
+        "9" * 400,
+        "1e400",
+        "1199.999999",
+        "1200",
+    ]
+
+    @pytest.mark.parametrize(
+        "check_fn,kwargs",
+        [
+            (check_functions.is_number, {}),
+            (check_functions.is_number, {"accept_blank": True}),
+            (check_functions.is_number, {"is_whole": True}),
+            (check_functions.is_number, {"is_whole": True, "accept_blank": True}),
+            (check_functions.is_greater_than, {"min_value": "0"}),
+            (check_functions.is_greater_than, {"min_value": "1", "accept_blank": True}),
+            (check_functions.is_greater_than_or_equal_to, {"min_value": "1"}),
+            (check_functions.is_greater_than_or_equal_to, {"min_value": "0", "accept_blank": True}),
+            (check_functions.is_less_than, {"max_value": "1200"}),
+            (check_functions.is_less_than, {"max_value": "1200", "accept_blank": True}),
+        ],
+    )
+    def test_same_as_element_wise(self, check_fn, kwargs):
+        expr = EXPRESSION_BUILDERS[check_fn]("value", **kwargs)
+        normalized = {name for name in expr.meta.root_names() if check_expressions.is_normalized_column(name)}
+        results = (
+            pl.LazyFrame({"value": self.values})
+            .with_columns(check_expressions.normalized_column(name) for name in normalized)
+            .select(expr)
+            .collect()
+            .to_series()
+            .to_list()
+        )
+
+        for value, result in zip(self.values, results):
+            try:
+                expected = check_fn(value, **kwargs)
+            except ValueError:
+                # the element-wise comparisons raise for values that aren't numbers, which is_number reports.
+                # The expressions leave them null, which is treated as a pass.
+                expected = None
+            assert result == expected, repr(value)
+
+
+class TestVectorizedCodeChecks:
+    @pytest.mark.parametrize("codes", [global_data.census_geoids, global_data.naics_codes])
+    @pytest.mark.parametrize("accept_blank", [False, True])
+    def test_same_as_element_wise(self, codes, accept_blank):
+        code = next(iter(codes))
+        values = [code, f" {code}", f"{code} ", code[:-1], code + "0", "", " ", "\x1c", "abc", "0" * len(code)]
+        results = (
+            pl.LazyFrame({"value": values})
+            .select(check_expressions.is_valid_code("value", accept_blank=accept_blank, codes=codes))
+            .collect()
+            .to_series()
+            .to_list()
+        )
+        assert results == [check_functions.is_valid_code(v, accept_blank=accept_blank, codes=codes) for v in values]
+
+    def test_codes_built_once(self):
+        schemas = (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei())
+        for schema in schemas:
+            compile_schema(schema)
+        cache_info = check_expressions._code_values.cache_info()
+        for schema in schemas:
+            compile_schema(schema)
+        # every code set was already built, and is reused
+        assert (
+            check_expressions._code_values.cache_info().misses == cache_info.misses == len(check_expressions.CODE_SETS)
+        )
+        assert check_expressions._code_values.cache_info().hits == cache_info.hits + len(check_expressions.CODE_SETS)
+
+    def test_other_codes(self):
+        # codes that aren't one of the code sets are still checked
+        results = pl.DataFrame({"value": ["1", "2", ""]}).select(check_expressions.is_valid_code("value", codes={"1"}))
+        assert results.to_series().to_list() == [True, False, False]
+
+
+class TestVectorizedStringChecks:
+    values = ["", " ", "\x1c", "abc", "ééé", "123", "1234", "000TESTFIUIDDONOTUSE", "000TESTFIUIDDONOTUSEXGXVID11XTC1"]
+
+    def evaluate(self, expr: pl.Expr) -> list:
+        return pl.LazyFrame({"value": self.values}).select(expr).collect().to_series().to_list()
+
+    @pytest.mark.parametrize("containing_value", [None, "000TESTFIUIDDONOTUSE", "TEST", ""])
+    @pytest.mark.parametrize("start_idx,end_idx", [(None, None), (None, 20), (3, 7), (4, None), (-5, None), (1, -1)])
+    def test_string_contains(self, containing_value, start_idx, end_idx):
+        kwargs = dict(containing_value=containing_value, start_idx=start_idx, end_idx=end_idx)
+        assert self.evaluate(check_expressions.string_contains("value", **kwargs)) == [
+            check_functions.string_contains(v, **kwargs) for v in self.values
+        ]
+
+    @pytest.mark.parametrize("accepted_length", [0, 3, 11])
+    @pytest.mark.parametrize("accept_blank", [False, True])
+    def test_has_correct_length(self, accepted_length, accept_blank):
+        kwargs = dict(accepted_length=accepted_length, accept_blank=accept_blank)
+        assert self.evaluate(check_expressions.has_correct_length("value", **kwargs)) == [
+            check_functions.has_correct_length(v, **kwargs) for v in self.values
+        ]
+
+
+class TestVectorizedMultiValueChecks:
+    values = ["1", "977", "977;977", "1;977", "1;2", "1;1", "", "x;977", "988", "977;988"]
+
+    @pytest.mark.parametrize("single_values", [{"977"}, {"977", "988"}])
+    def test_meets_multi_value_field_restriction(self, single_values):
+        results = (
+            pl.LazyFrame({"value": self.values})
+            .with_columns(check_expressions.normalized_column("value:split:;"))
+            .select(check_expressions.meets_multi_value_field_restriction("value", single_values))
+            .collect()
+            .to_series()
+            .to_list()
+        )
+        assert results == [check_functions.meets_multi_value_field_restriction(v, single_values) for v in self.values]
+
+
+class TestBitsetChecks:
+    def fuzz(self, rows: int = 2000) -> pl.DataFrame:
+        rng = random.Random(7)
+        df = pl.read_csv(ALL_LOGIC_ERRORS, infer_schema_length=0, missing_utf8_is_empty_string=True)
+        df = df.sample(rows, with_replacement=True, seed=7)
+        for field, codes in enum_codes().items():
+            values = []
+            for value in df[field]:
+                if rng.random() < 0.8:
+                    # codes, other values, blanks, whitespace and repeats, in single and multi-value fields
+                    choices = codes + ["", " ", "x", "x", f" {codes[0]}", "977", "1"]
+                    value = rng.choice([";", " ;", "; "]).join(rng.choices(choices, k=rng.choice([1, 1, 2, 3, 5])))
+                values.append(value)
+            df = df.with_columns(pl.Series(field, values))
+        return df
+
+    def test_enum_codes(self):
+        codes = enum_codes()
+        assert codes["po_1_ethnicity"] == ["1", "11", "12", "13", "14", "2", "966", "977", "988"]
+        assert all(len(field_codes) <= 63 for field_codes in codes.values())
+
+    def test_compile_schema(self):
+        for schema in (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei()):
+            compiled = compile_schema(schema, bitsets=True)
+            assert any(":bits:" in name for c in compiled.checks for name in c.normalized)
+            assert [c.id for c in compiled.checks] == [c.id for c in compile_schema(schema).checks]
+
+    def test_same_as_lists(self):
+        df = self.fuzz()
+        for schema in (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei()):
+            lists = compile_schema(schema)
+            bitsets = compile_schema(schema, bitsets=True)
+            ids = [c.id for c in lists.checks if c.check._check_fn in BITSET_BUILDERS]
+            expected, results = evaluate_checks(lists, df).select(ids), evaluate_checks(bitsets, df).select(ids)
+            for id in ids:
+                assert results[id].equals(expected[id]), id
+
+
+class TestDistinctChecks:
+    def test_compile_schema(self):
+        for schema in (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei()):
+            compiled_schema = compile_schema(schema, distinct=True)
+            assert compiled_schema.distinct
+            assert select_checks(compiled_schema, [compiled_schema.checks[0].id]).distinct
+            for compiled in compiled_schema.checks:
+                if compiled.check.element_wise and compiled.fields == [compiled.column]:
+                    assert compiled.row_wise, compiled.id
+                if compiled.row_wise:
+                    fields = {check_expressions.normalized_field(name) for name in compiled.expr.meta.root_names()}
+                    assert fields <= {compiled.column}, compiled.id
+
+    def test_column_wise(self):
+        compiled = compile_schema(get_register_schema(), distinct=True)
+        unique_column = [c for c in compiled.checks if c.check._check_fn is check_functions.is_unique_column]
+        assert unique_column and not any(c.row_wise for c in unique_column)
+
+    @pytest.mark.parametrize("rows", [7, 2000])
+    @pytest.mark.parametrize("bitsets", [False, True])
+    def test_same_as_rows(self, rows, bitsets):
+        # few rows have mostly distinct values, many rows have mostly repeated values
+        df = TestBitsetChecks().fuzz(rows)
+        for schema in (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei()):
+            expected = evaluate_checks(compile_schema(schema, bitsets), df)
+            assert evaluate_checks(compile_schema(schema, bitsets, distinct=True), df).equals(expected)
+
+
+class TestCategoricalChunks:
+    def test_encode(self):
+        df = TestBitsetChecks().fuzz()
+        encoded = encode(df)
+        assert all(encoded.schema[field] == pl.Categorical for field in enum_codes())
+        assert encoded.schema["uid"] == pl.String
+        # values that aren't codes are kept as they are
+        assert decode(encoded).equals(df)
+        assert encode(encoded) is encoded and decode(df) is df
+
+    def test_same_as_strings(self):
+        df = TestBitsetChecks().fuzz()
+        for schema in (compile_schema(get_phase_1_schema_for_lei()), compile_schema(get_phase_2_schema_for_lei())):
+            assert evaluate_checks(schema, encode(df)).equals(evaluate_checks(schema, df))
+
+    @pytest.mark.parametrize("bitsets", [False, True])
+    def test_checks_read_encoded_fields(self, monkeypatch, bitsets):
+        decode, distinct_values = engine.decode, engine.distinct_values
+        decoded, checked = [], []
+
+        def recording_decode(df, columns=None):
+            decoded_df = decode(df, columns)
+            decoded.extend(c for c in df.columns if df.schema[c] != decoded_df.schema[c])
+            return decoded_df
+
+        def recording_distinct_values(values):
+            checked.append((values.name, values.dtype))
+            return distinct_values(values)
+
+        monkeypatch.setattr(engine, "decode", recording_decode)
+        monkeypatch.setattr(engine, "distinct_values", recording_distinct_values)
+        df = TestBitsetChecks().fuzz()
+        for schema in (get_phase_1_schema_for_lei(), get_phase_2_schema_for_lei()):
+            compiled = compile_schema(schema, bitsets)
+            assert evaluate_checks(compiled, encode(df)).equals(evaluate_checks(compiled, df))
+
+        # the encoded fields are never decoded, their checks are evaluated on their categories
+        assert decoded == []
+        assert {name for name, dtype in checked if dtype == pl.Categorical} == set(enum_codes())
+
+    @pytest.mark.parametrize("bitsets", [False, True])
+    def test_normalize(self, bitsets):
+        df = TestBitsetChecks().fuzz()
+        schemas = [compile_schema(get_phase_1_schema_for_lei(), bitsets), compile_schema(get_phase_2_schema_for_lei())]
+        normalized = normalize(schemas, encode(df)).drop(df.columns)
+        # the checks of encoded fields are evaluated on their categories, so only the normalized columns read by
+        # the checks of other fields are added, which are computed from the categories
+        assert any(check_expressions.normalized_field(name) in enum_codes() for name in normalized.columns)
+        assert normalize(schemas, df).select(normalized.columns).equals(normalized)
+
+
+# options of the Polars engine that change how the checks are evaluated, but never the findings
+class TestEngineOptions:
+    @pytest.mark.parametrize(
+        "path,context",
+        [
+            (GOOD_FILE_PATH, {"lei": "000TESTFIUIDDONOTUS1"}),
+            (ALL_SYNTAX_ERRORS, None),
+            (ALL_LOGIC_ERRORS, None),
+            (ALL_LOGIC_WARNINGS, {"lei": "000TESTFIUIDDONOTUSE"}),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"bitsets": True},
+            {"distinct": True},
+            {"categorical": True},
+            {"categorical": True, "speculative": True},
+            {"bitsets": True, "distinct": True, "categorical": True},
+        ],
+    )
+    def test_same_findings(self, path, context, options):
+        # speculative changes which results there are, so the expected results are validated with it too
+        expected = list(
+            validate_batch_csv(
+                path, context, engine=ValidationEngine.POLARS, speculative=options.get("speculative", False)
+            )
+        )
+        results = list(validate_batch_csv(path, context, engine=ValidationEngine.POLARS, **options))
+
+        assert_same_results(expected, results, counts=False)
+
+    @pytest.mark.parametrize("option", ["bitsets", "distinct", "categorical"])
+    def test_pandera_engine(self, option):
+        with pytest.raises(ValueError):
+            next(validate_batch_csv(GOOD_FILE_PATH, engine=ValidationEngine.PANDERA, **{option: True}))
+
+    @pytest.mark.parametrize(
+        "options,option", [({"validation_ids": []}, "validation_ids"), ({"distinct": True}, "distinct")]
+    )
+    def test_check_engine(self, options, option):
+        PolarsOptions().check_engine(ValidationEngine.PANDERA)
+        PolarsOptions(**options).check_engine(ValidationEngine.POLARS)
+        with pytest.raises(ValueError, match=f"{option} is only supported"):
+            PolarsOptions(**options).check_engine(ValidationEngine.PANDERA)
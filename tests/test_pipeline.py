@@ -0,0 +1,98 @@
+import threading
+from queue import Queue
+
+import pytest
+
+from regtech_data_validator import pipeline
+from regtech_data_validator.pipeline import look_ahead, staged
+
+
+class TestStaged:
+    def test_same_results_in_order(self):
+        assert list(staged(lambda x: x * 2, iter(range(100)), 3)) == [x * 2 for x in range(100)]
+
+    def test_runs_on_separate_thread(self):
+        caller = threading.get_ident()
+        threads = set(staged(lambda _: threading.get_ident(), iter(range(5)), 1))
+
+        assert threads and caller not in threads
+
+    def test_bounded_queue(self, monkeypatch):
+        queues = []
+        blocked = threading.Condition()
+        blocked_on = []
+
+        class RecordingQueue(Queue):
+            def __init__(self, maxsize):
+                super().__init__(maxsize)
+                queues.append(self)
+
+            def put(self, item, block=True, timeout=None):
+                # only the caller takes from the queue, so the stage stays blocked until the caller takes again
+                if self.full():
+                    with blocked:
+                        blocked_on.append(item[0])
+                        blocked.notify_all()
+                super().put(item, block, timeout)
+
+        def wait_blocked_on(item):
+            with blocked:
+                assert blocked.wait_for(lambda: item in blocked_on, timeout=10)
+
+        monkeypatch.setattr(pipeline, "Queue", RecordingQueue)
+        produced = []
+        results = staged(lambda x: produced.append(x) or x, iter(range(100)), 2)
+
+        assert next(results) == 0
+        wait_blocked_on(3)
+        # one item taken by the caller, two waiting in the queue and one waiting to be put into the queue
+        assert queues[0].qsize() == 2
+        assert produced == [0, 1, 2, 3]
+
+        assert next(results) == 1
+        wait_blocked_on(4)
+        assert queues[0].qsize() == 2
+        assert produced == [0, 1, 2, 3, 4]
+        results.close()
+
+    def test_reraises_errors(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError("bad item")
+            return x
+
+        results = staged(fail, iter(range(10)), 2)
+        assert [next(results) for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(ValueError, match="bad item"):
+            next(results)
+
+    def test_close_stops_stage(self):
+        closed = threading.Event()
+
+        def items():
+            try:
+                yield from range(1000)
+            finally:
+                closed.set()
+
+        results = staged(lambda x: x, items(), 1)
+        next(results)
+        results.close()
+
+        assert closed.is_set()
+
+    def test_invalid_queue_size(self):
+        with pytest.raises(ValueError):
+            staged(lambda x: x, iter([]), 0)
+
+
+class TestLookAhead:
+    def test_same_results_in_order(self):
+        assert list(look_ahead(lambda x: x * 2, iter(range(10)), 3)) == [x * 2 for x in range(10)]
+
+    def test_applies_ahead(self):
+        applied = []
+        results = look_ahead(lambda x: applied.append(x) or x, iter(range(10)), 3)
+
+        assert next(results) == 0
+        assert applied == [0, 1, 2, 3]
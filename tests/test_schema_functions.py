@@ -1,10 +1,25 @@
 import polars as pl
 import pytest
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Thread, current_thread
 
-from regtech_data_validator.validator import validate_batch_csv
-from regtech_data_validator.validation_results import ValidationPhase
+from regtech_data_validator import validator
+from regtech_data_validator.engine import ValidationEngine
+from regtech_data_validator.validator import get_scope_counts, validate_batch_csv
+from regtech_data_validator.validation_results import Counts, ValidationPhase
+from regtech_data_validator.phase_validations import (
+    SCHEMA_CACHE_SIZE,
+    _get_cached_schema_for_lei,
+    get_phase_1_schema_for_lei,
+    get_phase_2_schema_for_lei,
+    get_register_schema,
+    phase_2_template,
+)
+
+from tests.conftest import assert_same_results
 
 
 @pytest.fixture
@@ -281,3 +296,495 @@ class TestValidatePhases:
         assert results[1].findings.height == 2
         assert results[1].findings.select(pl.col('validation_id').eq('E3000').all()).item()
         assert results[1].phase == ValidationPhase.LOGICAL
+
+
+class TestSchemaCache:
+
+    def test_same_lei_reuses_schema(self):
+        assert get_phase_1_schema_for_lei({'lei': "000TESTFIUIDDONOTUSE"}) is get_phase_1_schema_for_lei(
+            {'lei': "000TESTFIUIDDONOTUSE"}
+        )
+        assert get_phase_2_schema_for_lei({'lei': "000TESTFIUIDDONOTUSE"}) is get_phase_2_schema_for_lei(
+            {'lei': "000TESTFIUIDDONOTUSE"}
+        )
+        assert get_register_schema() is get_register_schema({'lei': "000TESTFIUIDDONOTUSE"})
+
+    def test_schema_per_lei(self):
+        schema_1 = get_phase_2_schema_for_lei({'lei': "000TESTFIUIDDONOTUS1"})
+        schema_2 = get_phase_2_schema_for_lei({'lei': "000TESTFIUIDDONOTUS2"})
+
+        assert schema_1.columns['uid'].checks[0]._check_kwargs['containing_value'] == "000TESTFIUIDDONOTUS1"
+        assert schema_2.columns['uid'].checks[0]._check_kwargs['containing_value'] == "000TESTFIUIDDONOTUS2"
+        assert get_phase_2_schema_for_lei().columns['uid'].checks[0]._check_kwargs['containing_value'] is None
+
+    def test_cache_is_bounded(self):
+        assert _get_cached_schema_for_lei.cache_info().maxsize == SCHEMA_CACHE_SIZE
+
+
+class TestConcurrency:
+    @pytest.fixture
+    def fast_thread_switching(self):
+        # switch threads as often as possible, so races show up
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        yield
+        sys.setswitchinterval(interval)
+
+    def test_build_schemas_concurrently(self, fast_thread_switching):
+        _get_cached_schema_for_lei.cache_clear()
+        leis = [f"{n:020d}" for n in range(SCHEMA_CACHE_SIZE)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            schemas = list(executor.map(lambda lei: get_phase_2_schema_for_lei({'lei': lei}), leis))
+
+        for lei, schema in zip(leis, schemas):
+            assert schema.columns['uid'].checks[0]._check_kwargs['containing_value'] == lei
+        # the template used to build the schemas is left untouched
+        assert all(not column.checks for column in phase_2_template.values())
+
+    def test_validate_concurrently(self, fast_thread_switching):
+        # every uid in the file starts with 123456789TESTBANK123, so every row has a W0003 warning for other LEIs
+        leis = ["123456789TESTBANK123", "000TESTFIUIDDONOTUS1"] * 4
+
+        def validate_lei(lei):
+            return list(validate_batch_csv("./tests/data/sblar_no_findings.csv", {'lei': lei}, batch_size=2))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_results = list(executor.map(validate_lei, leis))
+
+        for lei, results in zip(leis, all_results):
+            findings = [r.findings for r in results if not r.findings.is_empty()]
+            if lei == "123456789TESTBANK123":
+                assert not findings
+            else:
+                findings = pl.concat(findings)
+                assert set(findings["validation_id"]) == {"W0003"}
+                assert findings["row"].to_list() == list(range(2, 12))
+
+
+class TestParallelChunks:
+    @pytest.mark.parametrize(
+        "path,batch_size,max_errors,engine,workers,queue_size",
+        [
+            ("./tests/data/all_syntax_errors.csv", 7, 1000000, ValidationEngine.POLARS, 4, 0),
+            ("./tests/data/all_syntax_errors.csv", 7, 20, ValidationEngine.POLARS, 4, 0),
+            ("./tests/data/all_syntax_errors.csv", 3, 1, ValidationEngine.POLARS, 4, 0),
+            ("./tests/data/all_logic_errors.csv", 7, 1000000, ValidationEngine.POLARS, 4, 0),
+            ("./tests/data/all_logic_errors.csv", 5, 30, ValidationEngine.POLARS, 4, 0),
+            ("./tests/data/all_logic_errors.csv", 7, 30, ValidationEngine.PANDERA, 4, 0),
+            ("./tests/data/all_syntax_errors.csv", 3, 1000000, ValidationEngine.POLARS, 1, 1),
+            ("./tests/data/all_syntax_errors.csv", 3, 20, ValidationEngine.POLARS, 1, 2),
+            ("./tests/data/all_logic_errors.csv", 5, 30, ValidationEngine.POLARS, 4, 2),
+            ("./tests/data/all_logic_errors.csv", 7, 30, ValidationEngine.PANDERA, 2, 2),
+        ],
+    )
+    def test_same_results_as_sequential(self, path, batch_size, max_errors, engine, workers, queue_size):
+        sequential = list(validate_batch_csv(path, batch_size=batch_size, max_errors=max_errors, engine=engine))
+        parallel = list(
+            validate_batch_csv(
+                path,
+                batch_size=batch_size,
+                max_errors=max_errors,
+                engine=engine,
+                workers=workers,
+                queue_size=queue_size,
+            )
+        )
+
+        assert_same_results(sequential, parallel)
+
+    @pytest.mark.parametrize("flags", [{}, {"speculative": True, "bitsets": True, "distinct": True}])
+    def test_no_deadlock(self, tmp_path, flags):
+        df = pl.read_csv("./tests/data/all_logic_errors.csv", infer_schema_length=0)
+        df = df.sample(1500, with_replacement=True, seed=1).with_columns(
+            # numbers with underscores, which take the slower path of parsing numbers
+            amount_applied_for=pl.when(pl.int_range(pl.len()) % 7 == 0)
+            .then(pl.lit("1_000"))
+            .otherwise(pl.col("amount_applied_for"))
+        )
+        path = tmp_path / "fuzzed.csv"
+        df.write_csv(path)
+
+        expected = list(validate_batch_csv(path, batch_size=50, engine=ValidationEngine.POLARS, **flags))
+        runs = []
+
+        def validate_repeatedly():
+            for _ in range(5):
+                runs.append(
+                    list(
+                        validate_batch_csv(
+                            path, batch_size=50, engine=ValidationEngine.POLARS, workers=3, queue_size=2, **flags
+                        )
+                    )
+                )
+
+        # a deadlocked validation never returns, so it is run on a thread that can be given up on
+        thread = Thread(target=validate_repeatedly, daemon=True)
+        thread.start()
+        thread.join(timeout=300)
+        assert not thread.is_alive()
+        assert len(runs) == 5
+        for results in runs:
+            assert_same_results(expected, results)
+
+    @pytest.mark.parametrize(
+        "workers,queue_size,speculative",
+        [(3, 2, False), (3, 0, False), (1, 0, True), (2, 2, True)],
+    )
+    def test_python_checks_on_calling_thread(self, monkeypatch, workers, queue_size, speculative):
+        # Pandera's checks run Python, which must not be evaluated alongside other threads
+        evaluate_chunk = validator._evaluate_chunk
+        threads = set()
+
+        def recording_evaluate_chunk(*args):
+            threads.add(current_thread())
+            return evaluate_chunk(*args)
+
+        monkeypatch.setattr(validator, "_evaluate_chunk", recording_evaluate_chunk)
+
+        kwargs = dict(batch_size=7, max_errors=30, engine=ValidationEngine.PANDERA, speculative=speculative)
+        expected = list(validate_batch_csv("./tests/data/all_logic_errors.csv", **kwargs))
+        actual = list(
+            validate_batch_csv("./tests/data/all_logic_errors.csv", workers=workers, queue_size=queue_size, **kwargs)
+        )
+
+        assert threads == {current_thread()}
+        assert_same_results(expected, actual)
+
+
+class TestSpeculative:
+    @pytest.mark.parametrize(
+        "path,context,batch_size,max_errors,engine,workers,queue_size",
+        [
+            ("./tests/data/sblar_no_findings.csv", {'lei': "123456789TESTBANK123"}, 3, 1000000, "polars", 1, 0),
+            ("./tests/data/sblar_no_findings.csv", {'lei': "000TESTFIUIDDONOTUS1"}, 3, 5, "polars", 1, 0),
+            ("./tests/data/all_syntax_errors.csv", None, 7, 1000000, "polars", 1, 0),
+            ("./tests/data/all_syntax_errors.csv", None, 3, 20, "polars", 2, 2),
+            ("./tests/data/all_logic_errors.csv", None, 7, 1000000, "polars", 1, 0),
+            ("./tests/data/all_logic_errors.csv", None, 5, 30, "polars", 4, 2),
+            ("./tests/data/all_logic_warnings.csv", {'lei': "000TESTFIUIDDONOTUSE"}, 7, 1000000, "polars", 1, 0),
+            ("./tests/data/all_logic_errors.csv", None, 7, 30, "pandera", 1, 0),
+            ("./tests/data/all_syntax_errors.csv", None, 7, 1000000, "pandera", 1, 0),
+        ],
+    )
+    def test_same_results_as_phases(self, path, context, batch_size, max_errors, engine, workers, queue_size):
+        kwargs = dict(batch_size=batch_size, max_errors=max_errors, engine=engine)
+        expected = list(validate_batch_csv(path, context, **kwargs))
+        actual = list(
+            validate_batch_csv(path, context, workers=workers, queue_size=queue_size, speculative=True, **kwargs)
+        )
+
+        assert_same_results(expected, actual)
+
+    def test_logic_errors_discarded_with_syntax_errors(self, monkeypatch):
+        find_failed_rows = validator.find_failed_rows
+
+        def fail_logic_checks(schema, df):
+            if schema.name == ValidationPhase.LOGICAL:
+                raise RuntimeError("logic check failed on bad data")
+            return find_failed_rows(schema, df)
+
+        monkeypatch.setattr(validator, "find_failed_rows", fail_logic_checks)
+
+        results = list(
+            validate_batch_csv(
+                "./tests/data/all_syntax_errors.csv", batch_size=7, speculative=True, engine=ValidationEngine.POLARS
+            )
+        )
+        assert {r.phase for r in results} == {ValidationPhase.SYNTACTICAL}
+
+        with pytest.raises(RuntimeError, match="logic check failed on bad data"):
+            list(
+                validate_batch_csv(
+                    "./tests/data/all_logic_errors.csv", batch_size=7, speculative=True, engine=ValidationEngine.POLARS
+                )
+            )
+
+
+class TestMaxErrorsMode:
+    def sum_counts(self, results, phase):
+        phase_results = [r for r in results if r.phase == phase]
+        return (
+            sum(r.error_counts.total_count for r in phase_results),
+            sum(r.warning_counts.total_count for r in phase_results),
+        )
+
+    @pytest.mark.parametrize("engine,speculative", [("polars", False), ("pandera", False), ("polars", True)])
+    def test_stop(self, engine, speculative):
+        path = "./tests/data/all_syntax_errors.csv"
+        kwargs = dict(batch_size=3, max_errors=5, engine=engine, speculative=speculative)
+        continued = list(validate_batch_csv(path, **kwargs))
+        stopped = list(validate_batch_csv(path, max_errors_mode="stop", **kwargs))
+
+        assert len(stopped) < len(continued)
+        assert [r.is_partial for r in stopped] == [False] * (len(stopped) - 1) + [True]
+        assert not any(r.is_partial for r in continued)
+        for expected, actual in zip(continued, stopped):
+            assert actual.error_counts == expected.error_counts
+            assert actual.findings.equals(expected.findings)
+        assert sum(r.findings.height for r in stopped) == 5
+
+    @pytest.mark.parametrize("speculative", [False, True])
+    def test_stop_logic_phase(self, speculative):
+        path = "./tests/data/all_logic_errors.csv"
+        kwargs = dict(batch_size=3, max_errors=5, max_errors_mode="stop", engine="polars")
+        stopped = list(validate_batch_csv(path, speculative=speculative, **kwargs))
+
+        logic_results = [r for r in stopped if r.phase == ValidationPhase.LOGICAL]
+        assert [r.is_partial for r in stopped] == [False] * (len(stopped) - 1) + [True]
+        assert sum(r.findings.height for r in logic_results[1:]) == 5
+        # the logic results held back by speculative validation stop where the logic phase would have
+        assert_same_results(list(validate_batch_csv(path, **kwargs)), stopped)
+
+    def test_stop_not_reached(self):
+        path = "./tests/data/all_logic_errors.csv"
+        results = list(validate_batch_csv(path, batch_size=3, max_errors_mode="stop"))
+
+        assert not any(r.is_partial for r in results)
+
+    @pytest.mark.parametrize(
+        "path,engine,workers,queue_size,speculative",
+        [
+            ("./tests/data/all_syntax_errors.csv", "polars", 1, 0, False),
+            ("./tests/data/all_syntax_errors.csv", "pandera", 1, 0, False),
+            ("./tests/data/all_logic_errors.csv", "polars", 1, 0, False),
+            ("./tests/data/all_logic_errors.csv", "polars", 4, 2, False),
+            ("./tests/data/all_logic_errors.csv", "polars", 1, 0, True),
+            ("./tests/data/all_logic_warnings.csv", "polars", 2, 0, False),
+        ],
+    )
+    def test_count(self, path, engine, workers, queue_size, speculative):
+        kwargs = dict(batch_size=3, engine=engine, workers=workers, queue_size=queue_size, speculative=speculative)
+        uncapped = list(validate_batch_csv(path, **kwargs))
+        continued = list(validate_batch_csv(path, max_errors=5, **kwargs))
+        counted = list(validate_batch_csv(path, max_errors=5, max_errors_mode="count", **kwargs))
+
+        assert_same_results(continued, counted, counts=False)
+        for phase in ValidationPhase:
+            assert self.sum_counts(counted, phase) == self.sum_counts(uncapped, phase)
+        assert [r.is_valid for r in counted] == [r.is_valid for r in uncapped]
+
+
+class TestSummary:
+    def findings_by_phase(self, results):
+        findings = {}
+        for r in results:
+            if not r.findings.is_empty():
+                findings.setdefault(r.phase, []).append(r.findings)
+        return {phase: pl.concat(phase_findings, how="diagonal") for phase, phase_findings in findings.items()}
+
+    @pytest.mark.parametrize(
+        "path,context,engine,speculative",
+        [
+            ("./tests/data/sblar_no_findings.csv", {'lei': "123456789TESTBANK123"}, "polars", False),
+            ("./tests/data/all_syntax_errors.csv", None, "polars", False),
+            ("./tests/data/all_syntax_errors.csv", None, "pandera", False),
+            ("./tests/data/all_syntax_errors.csv", None, "polars", True),
+            ("./tests/data/all_logic_errors.csv", None, "polars", False),
+            ("./tests/data/all_logic_errors.csv", None, "polars", True),
+            ("./tests/data/all_logic_errors.csv", None, "pandera", False),
+            ("./tests/data/all_logic_warnings.csv", {'lei': "000TESTFIUIDDONOTUSE"}, "polars", False),
+        ],
+    )
+    def test_same_counts_without_findings(self, path, context, engine, speculative):
+        kwargs = dict(batch_size=3, engine=engine, speculative=speculative)
+        expected = list(validate_batch_csv(path, context, **kwargs))
+        summary = list(validate_batch_csv(path, context, summary=True, **kwargs))
+
+        assert_same_results(expected, summary, findings=False)
+        for summary_results in summary:
+            assert summary_results.findings.is_empty()
+            assert sum(summary_results.check_counts.values()) == (
+                summary_results.error_counts.total_count + summary_results.warning_counts.total_count
+            )
+
+    def test_speculative_stops_after_syntax_errors(self, monkeypatch):
+        count_failures = validator.count_failures
+        counted = []
+
+        def recording_count_failures(schema, df):
+            counted.append(schema.name)
+            return count_failures(schema, df)
+
+        monkeypatch.setattr(validator, "count_failures", recording_count_failures)
+        list(
+            validate_batch_csv(
+                "./tests/data/all_syntax_errors.csv",
+                batch_size=3,
+                engine=ValidationEngine.POLARS,
+                speculative=True,
+                summary=True,
+            )
+        )
+
+        # the logic checks are only counted for the first chunk, which is evaluated before its syntax errors are known
+        assert counted.count(ValidationPhase.LOGICAL) == 1
+        assert counted.count(ValidationPhase.SYNTACTICAL) > 1
+
+    @pytest.mark.parametrize("speculative", [False, True])
+    def test_no_findings_built(self, monkeypatch, speculative):
+        def fail(*args):
+            raise AssertionError("findings built for a summary")
+
+        monkeypatch.setattr(validator, "find_failed_rows", fail)
+        monkeypatch.setattr(validator, "build_findings", fail)
+        results = list(
+            validate_batch_csv(
+                "./tests/data/all_logic_errors.csv",
+                batch_size=3,
+                engine=ValidationEngine.POLARS,
+                speculative=speculative,
+                summary=True,
+            )
+        )
+
+        assert ValidationPhase.LOGICAL in {r.phase for r in results}
+
+    def test_fetch_findings_later(self):
+        path = "./tests/data/all_logic_errors.csv"
+        summary = list(validate_batch_csv(path, summary=True))
+        check_counts = {}
+        for r in summary:
+            for check_id, count in r.check_counts.items():
+                check_counts[check_id] = check_counts.get(check_id, 0) + count
+        validation_ids = sorted(check_counts)[:3]
+
+        fetched = self.findings_by_phase(
+            validate_batch_csv(path, validation_ids=validation_ids, engine=ValidationEngine.POLARS)
+        )
+        expected = self.findings_by_phase(validate_batch_csv(path, engine=ValidationEngine.POLARS))
+
+        for phase, phase_findings in expected.items():
+            selected = phase_findings.filter(pl.col("validation_id").is_in(validation_ids))
+            if selected.is_empty():
+                assert phase not in fetched
+            else:
+                # the selected checks may have fewer fields than all of the checks
+                assert fetched[phase].equals(selected.select(fetched[phase].columns))
+                assert all(selected.drop(fetched[phase].columns).select(pl.all().is_null().all()).row(0))
+        assert sum(f.height for f in fetched.values()) == sum(check_counts[i] for i in validation_ids)
+
+    def test_validation_ids_requires_polars_engine(self):
+        with pytest.raises(ValueError):
+            list(validate_batch_csv("./tests/data/all_logic_errors.csv", engine="pandera", validation_ids=["E0001"]))
+
+
+class TestFindingsCaps:
+    @pytest.mark.parametrize(
+        "path,engine,workers,queue_size",
+        [
+            ("./tests/data/all_syntax_errors.csv", "polars", 1, 0),
+            ("./tests/data/all_syntax_errors.csv", "pandera", 1, 0),
+            ("./tests/data/all_logic_errors.csv", "polars", 1, 0),
+            ("./tests/data/all_logic_errors.csv", "polars", 4, 2),
+            ("./tests/data/all_logic_errors.csv", "pandera", 1, 0),
+        ],
+    )
+    def test_max_findings_per_check(self, path, engine, workers, queue_size):
+        kwargs = dict(batch_size=3, engine=engine, workers=workers, queue_size=queue_size)
+        uncapped = list(validate_batch_csv(path, **kwargs))
+        capped = list(validate_batch_csv(path, max_findings_per_check=1, **kwargs))
+
+        for phase in ValidationPhase:
+            findings = [r.findings for r in capped if r.phase == phase and not r.findings.is_empty()]
+            if findings:
+                assert pl.concat(findings, how="diagonal")["validation_id"].value_counts()["count"].max() == 1
+        assert_same_results(uncapped, capped, findings=False)
+
+    @pytest.mark.parametrize("engine", ["polars", "pandera"])
+    def test_counts_past_max_errors(self, engine):
+        path = "./tests/data/all_logic_errors.csv"
+        uncapped = list(validate_batch_csv(path, batch_size=3, engine=engine))
+        capped = list(validate_batch_csv(path, batch_size=3, engine=engine, max_errors=5))
+
+        # the chunk that reaches max_errors is counted in full, though only some of its findings are kept
+        for expected, actual in zip(uncapped, capped):
+            if not actual.findings.is_empty():
+                assert actual.error_counts == expected.error_counts
+                # the findings that were kept have the same field columns as all of the findings
+                assert actual.findings.equals(expected.findings.head(actual.findings.height))
+        # the first logic results are for the register check, which max_errors does not apply to
+        logic_findings = [r.findings for r in capped if r.phase == ValidationPhase.LOGICAL][1:]
+        assert sum(f.height for f in logic_findings) == 5
+
+
+class TestRunningCounts:
+    def test_scope_counts(self):
+        findings = pl.DataFrame(
+            {
+                "validation_type": ["Error", "Error", "Error", "Warning", "Warning", "Error"],
+                "scope": ["single-field", "single-field", "register", "multi-field", "single-field", "multi-field"],
+            }
+        )
+        error_counts, warning_counts = get_scope_counts(findings)
+
+        assert error_counts == Counts(single_field_count=2, multi_field_count=1, register_count=1, total_count=4)
+        assert warning_counts == Counts(single_field_count=1, multi_field_count=1, total_count=2)
+        assert get_scope_counts(pl.DataFrame()) == (Counts(), Counts())
+
+    @pytest.mark.parametrize(
+        "path,engine,summary",
+        [
+            ("./tests/data/all_syntax_errors.csv", "polars", False),
+            ("./tests/data/all_logic_errors.csv", "polars", False),
+            ("./tests/data/all_logic_errors.csv", "polars", True),
+            ("./tests/data/all_logic_errors.csv", "pandera", False),
+        ],
+    )
+    def test_totals(self, path, engine, summary):
+        total_error_counts, total_warning_counts = Counts(), Counts()
+        for r in validate_batch_csv(path, batch_size=3, engine=engine, summary=summary):
+            total_error_counts += r.error_counts
+            total_warning_counts += r.warning_counts
+            assert r.total_error_counts == total_error_counts
+            assert r.total_warning_counts == total_warning_counts
+        assert total_error_counts.total_count > 0
+
+
+class TestColumnProjection:
+    def read_columns(self, monkeypatch):
+        read_columns = []
+        read_chunks = validator._read_chunks
+
+        def recording_read_chunks(*args, **kwargs):
+            for row_start, df in read_chunks(*args, **kwargs):
+                read_columns.append(df.columns)
+                yield row_start, df
+
+        monkeypatch.setattr(validator, "_read_chunks", recording_read_chunks)
+        return read_columns
+
+    def test_register_only(self, monkeypatch):
+        path = "./tests/data/all_logic_errors.csv"
+        read_columns = self.read_columns(monkeypatch)
+        results = list(validate_batch_csv(path, batch_size=3, validation_ids=["E3000"], engine=ValidationEngine.POLARS))
+
+        assert read_columns and all(columns == ["uid"] for columns in read_columns)
+        expected = [
+            r
+            for r in validate_batch_csv(path, batch_size=3, engine=ValidationEngine.POLARS)
+            if "E3000" in r.check_counts
+        ]
+        register_results = [r for r in results if "E3000" in r.check_counts]
+        assert len(register_results) == len(expected) == 1
+        assert register_results[0].findings.equals(expected[0].findings)
+
+    def test_selected_checks(self, monkeypatch):
+        path = "./tests/data/all_logic_errors.csv"
+        read_columns = self.read_columns(monkeypatch)
+        results = list(
+            validate_batch_csv(path, batch_size=3, validation_ids=["E2000", "E2003"], engine=ValidationEngine.POLARS)
+        )
+
+        assert all(
+            set(columns) == {"uid", "ct_credit_product_ff", "ct_credit_product", "ct_loan_term_flag"}
+            for columns in read_columns
+        )
+        assert {check_id for r in results for check_id in r.check_counts} <= {"E2000", "E2003"}
+
+    def test_missing_column(self, csv_df_mission_column_file):
+        with pytest.raises(RuntimeError) as re:
+            list(
+                validate_batch_csv(csv_df_mission_column_file, validation_ids=["E3000"], engine=ValidationEngine.POLARS)
+            )
+        assert "column 'uid' not in dataframe" in str(re.value)
@@ -0,0 +1,118 @@
+import os
+
+import polars as pl
+import pytest
+
+from regtech_data_validator.phase_validations import get_register_schema
+from regtech_data_validator.uid_register import UidRegister
+from regtech_data_validator.validator import validate, validate_batch_csv
+
+GOOD_FILE_PATH = "./tests/data/sblar_no_findings.csv"
+
+
+@pytest.fixture
+def duplicate_uids_file(tmp_path):
+    df = pl.read_csv(GOOD_FILE_PATH, infer_schema_length=0, missing_utf8_is_empty_string=True)
+    # duplicate rows within the same chunk and across chunks
+    df = pl.concat([df, df.slice(2, 3), df.slice(0, 1)])
+    path = tmp_path / "duplicate_uids.csv"
+    df.write_csv(path)
+    return path
+
+
+class TestUidRegister:
+    uids = [["a", "b", "c"], ["d", "a", "e"], ["b", "f"], ["a"]]
+
+    @pytest.mark.parametrize("partitions", [0, 1, 4])
+    def test_duplicates(self, partitions):
+        register = UidRegister(partitions)
+        for chunk in self.uids:
+            register.add(pl.Series(chunk))
+
+        duplicates = register.duplicates(map(pl.Series, self.uids))
+        assert duplicates["row"].to_list() == [0, 1, 4, 6, 8]
+        assert duplicates["uid"].to_list() == ["a", "b", "a", "b", "a"]
+        assert register.row_count == 9
+        register.close()
+
+    @pytest.mark.parametrize("partitions", [0, 4])
+    def test_no_duplicates(self, partitions):
+        register = UidRegister(partitions)
+        register.add(pl.Series(["a", "b"]))
+        register.add(pl.Series(["c"]))
+
+        duplicates = register.duplicates(self.unread_uids())
+        assert duplicates.is_empty()
+        assert duplicates.schema == {"row": pl.UInt32, "uid": pl.String}
+        register.close()
+
+    def test_empty(self):
+        assert UidRegister().duplicates(self.unread_uids()).is_empty()
+
+    @pytest.mark.parametrize("partitions", [0, 4])
+    def test_hash_collisions(self, monkeypatch, partitions):
+        # every uid has the same hash, so only comparing the uids themselves tells the duplicates apart
+        monkeypatch.setattr(pl.Series, "hash", lambda self, *args: pl.zeros(self.len(), pl.UInt64, eager=True))
+        register = UidRegister(partitions)
+        for chunk in self.uids:
+            register.add(pl.Series(chunk))
+
+        duplicates = register.duplicates(map(pl.Series, self.uids))
+        assert duplicates["row"].to_list() == [0, 1, 4, 6, 8]
+        assert duplicates["uid"].to_list() == ["a", "b", "a", "b", "a"]
+        register.close()
+
+    def test_uids_read_up_to_last_repeated_hash(self):
+        register = UidRegister()
+        read = []
+
+        def uids():
+            for chunk in [["a", "b"], ["a", "c"], ["d"]]:
+                read.append(chunk)
+                yield pl.Series(chunk)
+
+        for chunk in [["a", "b"], ["a", "c"], ["d"]]:
+            register.add(pl.Series(chunk))
+
+        assert register.duplicates(uids())["row"].to_list() == [0, 2]
+        assert read == [["a", "b"], ["a", "c"]]
+
+    def unread_uids(self):
+        # without any repeated hashes, the uids are never read back
+        raise AssertionError("the uids were read")
+        yield
+
+    def test_close_removes_spill_files(self):
+        register = UidRegister(2)
+        register.add(pl.Series(["a", "b", "a"]))
+        spill_dir = register._spill_dir
+        assert os.listdir(spill_dir)
+
+        register.close()
+        assert not os.path.exists(spill_dir)
+
+
+class TestRegisterFindings:
+    @pytest.mark.parametrize("engine", ["polars", "pandera"])
+    @pytest.mark.parametrize("register_partitions", [0, 3])
+    @pytest.mark.parametrize("speculative", [False, True])
+    def test_same_findings_as_whole_register(self, duplicate_uids_file, engine, register_partitions, speculative):
+        context = {"lei": "123456789TESTBANK123"}
+        df = pl.read_csv(duplicate_uids_file, infer_schema_length=0, missing_utf8_is_empty_string=True)
+        expected = validate(get_register_schema(context), df.select("uid"), 0, True)
+
+        results = list(
+            validate_batch_csv(
+                duplicate_uids_file,
+                context,
+                batch_size=4,
+                engine=engine,
+                register_partitions=register_partitions,
+                speculative=speculative,
+            )
+        )
+        register_results = results[1]
+
+        assert register_results.error_counts.register_count == 8
+        assert register_results.findings["row"].to_list() == [2, 4, 5, 6, 12, 13, 14, 15]
+        assert register_results.findings.equals(expected)